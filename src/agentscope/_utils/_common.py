@@ -48,6 +48,16 @@ def _json_loads_with_repair(
             A dictionary parsed from the JSON string after repair attempts.
             Returns an empty dict if all repair attempts fail.
     """
+    # Most of the strings, e.g. the complete tool arguments, are valid JSON,
+    # so they're loaded directly instead of going through `repair_json`,
+    # which loads, dumps and then loads the string again
+    try:
+        result = json.loads(json_str)
+    except (ValueError, TypeError):
+        pass
+    else:
+        return result if isinstance(result, dict) else {}
+
     try:
         repaired = repair_json(json_str, stream_stable=True)
         result = json.loads(repaired)
@@ -80,11 +90,17 @@ def _get_timestamp(add_random_suffix: bool = False) -> str:
 
     if add_random_suffix:
         # Add a random suffix to the timestamp
-        timestamp += f"_{os.urandom(3).hex()}"
+        timestamp = _add_random_suffix(timestamp)
 
     return timestamp
 
 
+def _add_random_suffix(timestamp: str) -> str:
+    """Append the random suffix used by timestamp-based ids to the given
+    timestamp."""
+    return f"{timestamp}_{os.urandom(3).hex()}"
+
+
 async def _is_async_func(func: Callable) -> bool:
     """Check if the given function is an async function, including
     coroutine functions, async generators, and coroutine objects.
@@ -1,11 +1,13 @@
 # -*- coding: utf-8 -*-
 """The dashscope API model classes."""
+import asyncio
 import copy
-import collections
+import functools
 import json
 import os
+import time
 import warnings
-from datetime import datetime
+from collections import OrderedDict
 from http import HTTPStatus
 from typing import (
     Any,
@@ -16,7 +18,10 @@ from typing import (
     List,
     Literal,
     Type,
+    Hashable,
+    cast,
 )
+import dashscope
 from pydantic import BaseModel
 from aioitertools import iter as giter
 
@@ -47,6 +52,43 @@ else:
     )
 
 
+_HTTP_OK = int(HTTPStatus.OK)
+"""The plain int of the HTTP OK status, compared with every streaming
+chunk."""
+
+_REPAIR_IN_THREAD_THRESHOLD = 64 * 1024
+"""The length of the streamed tool arguments above which the JSON repair is
+offloaded to a worker thread, so that it won't block the event loop."""
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_tool_from_base_model(structured_model: Type[BaseModel]) -> dict:
+    """Create the tool JSON schema from the given BaseModel class. The result
+    is cached by the class, since walking the Pydantic JSON schema is
+    expensive and the same class is usually passed in every call. Use
+    `_create_structured_tool` instead, which returns a copy of the cached
+    schema."""
+    return _create_tool_from_base_model(structured_model)
+
+
+def _create_structured_tool(structured_model: Type[BaseModel]) -> dict:
+    """Create the tool JSON schema that forces the model to generate
+    structured output.
+
+    Args:
+        structured_model (`Type[BaseModel]`):
+            The Pydantic BaseModel class that defines the expected structure.
+
+    Returns:
+        `dict`:
+            A deep copy of the cached tool JSON schema, so that the request
+            arguments can be modified without affecting later calls.
+    """
+    return copy.deepcopy(
+        _cached_tool_from_base_model(cast(Hashable, structured_model)),
+    )
+
+
 class DashScopeChatModel(ChatModelBase):
     """The DashScope chat model class, which unifies the Generation and
     MultimodalConversation APIs into one method.
@@ -79,6 +121,8 @@ class DashScopeChatModel(ChatModelBase):
         generate_kwargs: dict[str, JSONSerializableObject] | None = None,
         base_http_api_url: str | None = None,
         stream_tool_parsing: bool = True,
+        response_cache_size: int = 0,
+        stream_coalesce_ms: float = 0,
         **_kwargs: Any,
     ) -> None:
         """Initialize the DashScope chat model.
@@ -116,6 +160,19 @@ class DashScopeChatModel(ChatModelBase):
                 is repaired to valid dicts (`{"a": "x"}`) in real-time for
                 immediate tool function input. Otherwise, the input field
                 remains {} until the final chunk arrives.
+            response_cache_size (`int`, defaults to `0`):
+                The maximum number of non-streaming responses to cache for
+                deterministic requests, i.e. requests with `temperature`
+                set to 0. An identical request (messages, tools and
+                generation arguments) returns a copy of the cached response
+                without calling the API, whose usage has zero tokens. The
+                cache is disabled when set to 0.
+            stream_coalesce_ms (`float`, defaults to `0`):
+                The time window in milliseconds to coalesce the streaming
+                chunks into one yielded response. The chunks received within
+                the window since the last yield are merged, which reduces
+                the per-token overhead of slow consumers. Every chunk is
+                yielded when set to 0.
             **_kwargs (`Any`):
                 Additional keyword arguments.
         """
@@ -133,10 +190,13 @@ class DashScopeChatModel(ChatModelBase):
         self.multimodality = multimodality
         self.generate_kwargs = generate_kwargs or {}
         self.stream_tool_parsing = stream_tool_parsing
+        self.response_cache_size = response_cache_size
+        self.stream_coalesce_ms = stream_coalesce_ms
 
-        if base_http_api_url is not None:
-            import dashscope
+        # The LRU cache of the deterministic non-streaming responses
+        self._response_cache: OrderedDict[str, ChatResponse] = OrderedDict()
 
+        if base_http_api_url is not None:
             dashscope.base_http_api_url = base_http_api_url
 
         # Load headers from environment variable if exists
@@ -208,8 +268,6 @@ class DashScopeChatModel(ChatModelBase):
                 <https://help.aliyun.com/zh/dashscope/developer-reference/api-details>`_
                 for more detailed arguments.
         """
-        import dashscope
-
         kwargs = {
             "messages": messages,
             "model": self.model_name,
@@ -252,7 +310,7 @@ class DashScopeChatModel(ChatModelBase):
                     "ignored. The model will only perform structured output "
                     "generation without calling any other tools.",
                 )
-            format_tool = _create_tool_from_base_model(structured_model)
+            format_tool = _create_structured_tool(structured_model)
             kwargs["tools"] = self._format_tools_json_schemas(
                 [format_tool],
             )
@@ -260,7 +318,21 @@ class DashScopeChatModel(ChatModelBase):
                 format_tool["function"]["name"],
             )
 
-        start_datetime = datetime.now()
+        start_time = time.monotonic()
+        cache_key = None
+        if (
+            not self.stream
+            and self.response_cache_size > 0
+            and kwargs.get("temperature") == 0
+        ):
+            cache_key = self._get_response_cache_key(kwargs, structured_model)
+            cached_response = self._lookup_response_cache(
+                cache_key,
+                start_time,
+            )
+            if cached_response is not None:
+                return cached_response
+
         if self.multimodality or (
             self.multimodality is None
             and (
@@ -283,23 +355,121 @@ class DashScopeChatModel(ChatModelBase):
 
         if self.stream:
             return self._parse_dashscope_stream_response(
-                start_datetime,
+                start_time,
                 response,
                 structured_model,
             )
 
         parsed_response = await self._parse_dashscope_generation_response(
-            start_datetime,
+            start_time,
             response,
             structured_model,
         )
 
+        if cache_key is not None:
+            self._store_response_cache(cache_key, parsed_response)
+
         return parsed_response
 
+    def _lookup_response_cache(
+        self,
+        cache_key: str,
+        start_time: float,
+    ) -> ChatResponse | None:
+        """Look up the response cache, and return a copy of the cached
+        response with zero usage on a hit.
+
+        Args:
+            cache_key (`str`):
+                The key of the response cache.
+            start_time (`float`):
+                The `time.monotonic()` value when the call started.
+
+        Returns:
+            `ChatResponse | None`:
+                A copy of the cached response, or `None` on a miss.
+        """
+        cached_response = self._response_cache.get(cache_key)
+        if cached_response is None:
+            return None
+
+        self._response_cache.move_to_end(cache_key)
+        # No tokens are consumed since the API isn't called
+        return ChatResponse(
+            content=copy.deepcopy(cached_response.content),
+            usage=ChatUsage(
+                input_tokens=0,
+                output_tokens=0,
+                time=time.monotonic() - start_time,
+            ),
+            metadata=copy.deepcopy(cached_response.metadata),
+        )
+
+    def _store_response_cache(
+        self,
+        cache_key: str,
+        response: ChatResponse,
+    ) -> None:
+        """Store a copy of the response in the response cache, and evict the
+        least recently used entry if the cache is full.
+
+        Args:
+            cache_key (`str`):
+                The key of the response cache.
+            response (`ChatResponse`):
+                The parsed response to cache.
+        """
+        # Cache a copy, so that the caller modifying the returned
+        # response doesn't affect the cached one
+        self._response_cache[cache_key] = ChatResponse(
+            content=copy.deepcopy(response.content),
+            usage=response.usage,
+            metadata=copy.deepcopy(response.metadata),
+        )
+        if len(self._response_cache) > self.response_cache_size:
+            self._response_cache.popitem(last=False)
+
+    @staticmethod
+    def _get_response_cache_key(
+        kwargs: dict[str, Any],
+        structured_model: Type[BaseModel] | None,
+    ) -> str:
+        """Get the key of the response cache from the request arguments.
+
+        Args:
+            kwargs (`dict[str, Any]`):
+                The keyword arguments sent to the DashScope API, including
+                the messages, tools and generation arguments.
+            structured_model (`Type[BaseModel] | None`):
+                The structured model of the request, if any.
+
+        .. note:: The serialized request itself is used as the key rather
+         than a digest of it, so that the lookup only costs the str hash
+         computed by the dict, and a hash collision can never return the
+         response of another request.
+
+        Returns:
+            `str`:
+                The compactly serialized request.
+        """
+        model_path = None
+        if structured_model is not None:
+            model_path = (
+                f"{structured_model.__module__}."
+                f"{structured_model.__qualname__}"
+            )
+        return json.dumps(
+            [kwargs, model_path],
+            separators=(",", ":"),
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+
     # pylint: disable=too-many-branches, too-many-statements
     async def _parse_dashscope_stream_response(
         self,
-        start_datetime: datetime,
+        start_time: float,
         response: Union[
             AsyncGenerator[GenerationResponse, None],
             Generator[MultiModalConversationResponse, None, None],
@@ -310,8 +480,9 @@ class DashScopeChatModel(ChatModelBase):
             blocks and usages from it and yield ChatResponse objects.
 
         Args:
-            start_datetime (`datetime`):
-                The start datetime of the response generation.
+            start_time (`float`):
+                The start time of the response generation, measured by
+                `time.monotonic()`.
             response (
                 `Union[AsyncGenerator[GenerationResponse, None], Generator[ \
                 MultiModalConversationResponse, None, None]]`
@@ -332,122 +503,115 @@ class DashScopeChatModel(ChatModelBase):
             If `structured_model` is not `None`, the expected structured output
             will be stored in the metadata of the `ChatResponse`.
         """
-        acc_content, acc_thinking_content = "", ""
-        acc_tool_calls = collections.defaultdict(dict)
-        last_input_objs = {}  # Store last input_obj for each tool_call
+        # The text and thinking fragments, joined once per chunk
+        content_parts: list[str] = []
+        thinking_parts: list[str] = []
+        # The accumulated tool calls indexed by their stream index, where
+        # the unseen indices are kept as None
+        acc_tool_calls: list[dict | None] = []
+        # The last raw arguments length, input and input JSON length of each
+        # tool call
+        last_input_objs: dict[str, tuple[int, dict, int]] = {}
         metadata = None
         last_content = None
         usage = None
+        # Whether some chunks are coalesced and not yielded yet
+        has_pending = False
+        # The first chunk is always yielded immediately
+        last_yield_time = float("-inf")
 
         async for chunk in giter(response):
-            if chunk.status_code != HTTPStatus.OK:
+            if chunk.status_code != _HTTP_OK:
                 raise RuntimeError(
                     f"Failed to get response from _ API: {chunk}",
                 )
 
+            # Read the message fields once per chunk, since each access
+            # goes through the SDK's attribute/dict proxy
             message = chunk.output.choices[0].message
+            reasoning_content = message.get("reasoning_content")
+            content = message.content
+            tool_calls = message.get("tool_calls") or ()
+
+            # Whether this chunk carries any new content
+            is_dirty = bool(tool_calls)
 
             # Update reasoning content
-            if isinstance(message.get("reasoning_content"), str):
-                acc_thinking_content += message["reasoning_content"]
+            if isinstance(reasoning_content, str):
+                thinking_parts.append(reasoning_content)
+                is_dirty = is_dirty or bool(reasoning_content)
 
             # Update text content
-            if isinstance(message.content, str):
-                acc_content += message.content
-            elif isinstance(message.content, list):
-                for item in message.content:
+            if isinstance(content, str):
+                content_parts.append(content)
+                is_dirty = is_dirty or bool(content)
+            elif isinstance(content, list):
+                for item in content:
                     if isinstance(item, dict) and "text" in item:
-                        acc_content += item["text"]
+                        content_parts.append(item["text"])
+                        is_dirty = is_dirty or bool(item["text"])
 
-            # Update tool calls
-            for tool_call in message.get("tool_calls", []):
+            # Update tool calls. The name and arguments fragments are
+            # collected in lists and joined when building the blocks, to
+            # avoid re-copying the growing strings on every chunk
+            for tool_call in tool_calls:
                 index = tool_call.get("index", 0)
-
-                if "id" in tool_call and tool_call["id"] != acc_tool_calls[
-                    index
-                ].get("id"):
-                    acc_tool_calls[index]["id"] = (
-                        acc_tool_calls[index].get("id", "") + tool_call["id"]
+                if index >= len(acc_tool_calls):
+                    acc_tool_calls.extend(
+                        [None] * (index + 1 - len(acc_tool_calls)),
                     )
+                acc_tool_call = acc_tool_calls[index]
+                if acc_tool_call is None:
+                    acc_tool_call = acc_tool_calls[index] = {
+                        "id": "",
+                        "name_parts": [],
+                        "arg_parts": [],
+                    }
+
+                # The id is repeated in the chunks, so it's compared with the
+                # accumulated one and kept as a string
+                tool_id = tool_call.get("id")
+                if tool_id and tool_id != acc_tool_call["id"]:
+                    acc_tool_call["id"] += tool_id
 
                 if "function" in tool_call:
                     func = tool_call["function"]
                     if "name" in func:
-                        acc_tool_calls[index]["name"] = (
-                            acc_tool_calls[index].get("name", "")
-                            + func["name"]
-                        )
+                        acc_tool_call["name_parts"].append(func["name"])
 
                     if "arguments" in func:
-                        acc_tool_calls[index]["arguments"] = (
-                            acc_tool_calls[index].get("arguments", "")
-                            + func["arguments"]
-                        )
-
-            # Build content blocks (always include thinking and text)
-            content_blocks: list[TextBlock | ToolUseBlock | ThinkingBlock] = []
-
-            if acc_thinking_content:
-                content_blocks.append(
-                    ThinkingBlock(
-                        type="thinking",
-                        thinking=acc_thinking_content,
-                    ),
-                )
-
-            if acc_content:
-                content_blocks.append(
-                    TextBlock(
-                        type="text",
-                        text=acc_content,
-                    ),
-                )
-
-            for tool_call in acc_tool_calls.values():
-                # Only add intermediate tool use blocks if
-                # stream_tool_parsing is True
-                tool_id = tool_call.get("id", "")
-                input_str = tool_call.get("arguments")
-
-                # If parsing the tool input in streaming mode
-                if self.stream_tool_parsing:
-                    repaired_input = _json_loads_with_repair(
-                        input_str or "{}",
-                    )
-                    # If the new repaired input is shorter than one in the last
-                    # chunk, use the last one to avoid regression
-                    last_input = last_input_objs.get(tool_id, {})
-                    if len(json.dumps(last_input)) > len(
-                        json.dumps(repaired_input),
-                    ):
-                        repaired_input = last_input
-                    last_input_objs[tool_id] = repaired_input
-
-                else:
-                    # Otherwise, keep input as empty dict until the final chunk
-                    repaired_input = {}
-
-                content_blocks.append(
-                    ToolUseBlock(
-                        type="tool_use",
-                        id=tool_id,
-                        name=tool_call.get("name", ""),
-                        input=repaired_input,
-                        raw_input=input_str,
-                    ),
-                )
-
-                if structured_model:
-                    metadata = repaired_input
+                        acc_tool_call["arg_parts"].append(func["arguments"])
 
             if chunk.usage:
                 usage = ChatUsage(
                     input_tokens=chunk.usage.input_tokens,
                     output_tokens=chunk.usage.output_tokens,
-                    time=(datetime.now() - start_datetime).total_seconds(),
+                    time=time.monotonic() - start_time,
                     metadata=chunk.usage,
                 )
 
+            # Skip the chunks without new content (e.g. usage-only chunks),
+            # and coalesce the chunks received within the window into one
+            # response, since the accumulators already hold the full state.
+            # The pending state is flushed after the stream ends, so the
+            # latest usage is never lost.
+            if not is_dirty or (
+                self.stream_coalesce_ms > 0
+                and (time.monotonic() - last_yield_time) * 1000
+                < self.stream_coalesce_ms
+            ):
+                has_pending = True
+                continue
+
+            content_blocks, tool_input = await self._build_stream_blocks(
+                thinking_parts,
+                content_parts,
+                acc_tool_calls,
+                last_input_objs,
+            )
+            if structured_model and tool_input is not None:
+                metadata = tool_input
+
             if content_blocks:
                 parsed_chunk = ChatResponse(
                     content=content_blocks,
@@ -456,6 +620,27 @@ class DashScopeChatModel(ChatModelBase):
                 )
                 yield parsed_chunk
                 last_content = copy.deepcopy(content_blocks)
+                last_yield_time = time.monotonic()
+            has_pending = False
+
+        # Flush the chunks that were coalesced but not yielded yet
+        if has_pending:
+            content_blocks, tool_input = await self._build_stream_blocks(
+                thinking_parts,
+                content_parts,
+                acc_tool_calls,
+                last_input_objs,
+            )
+            if structured_model and tool_input is not None:
+                metadata = tool_input
+
+            if content_blocks:
+                yield ChatResponse(
+                    content=content_blocks,
+                    usage=usage,
+                    metadata=metadata,
+                )
+                last_content = copy.deepcopy(content_blocks)
 
         # If stream_tool_parsing is False, we need to parse the final tool
         # use inputs here
@@ -477,9 +662,117 @@ class DashScopeChatModel(ChatModelBase):
                 metadata=metadata,
             )
 
+    async def _build_stream_blocks(
+        self,
+        thinking_parts: list[str],
+        content_parts: list[str],
+        acc_tool_calls: list[dict | None],
+        last_input_objs: dict[str, tuple[int, dict, int]],
+    ) -> tuple[list[TextBlock | ToolUseBlock | ThinkingBlock], dict | None]:
+        """Build the content blocks from the accumulated streaming state.
+
+        Args:
+            thinking_parts (`list[str]`):
+                The accumulated reasoning fragments.
+            content_parts (`list[str]`):
+                The accumulated text fragments.
+            acc_tool_calls (`list[dict | None]`):
+                The accumulated tool calls indexed by their stream index.
+            last_input_objs (`dict[str, tuple[int, dict, int]]`):
+                The length of the last raw arguments, the last repaired
+                input and the length of its JSON dump of each tool call,
+                which is updated in place.
+
+        Returns:
+            `tuple[list[TextBlock | ToolUseBlock | ThinkingBlock], \
+            dict | None]`:
+                The content blocks, and the input of the last tool call
+                (`None` if there is no tool call).
+        """
+        # Build content blocks (always include thinking and text)
+        content_blocks: list[TextBlock | ToolUseBlock | ThinkingBlock] = []
+        tool_input = None
+        acc_thinking_content = "".join(thinking_parts)
+        acc_content = "".join(content_parts)
+
+        if acc_thinking_content:
+            content_blocks.append(
+                ThinkingBlock(
+                    type="thinking",
+                    thinking=acc_thinking_content,
+                ),
+            )
+
+        if acc_content:
+            content_blocks.append(
+                TextBlock(
+                    type="text",
+                    text=acc_content,
+                ),
+            )
+
+        for tool_call in acc_tool_calls:
+            if tool_call is None:
+                continue
+
+            # Only add intermediate tool use blocks if
+            # stream_tool_parsing is True
+            tool_id = tool_call["id"]
+            input_str = "".join(tool_call["arg_parts"])
+
+            # If parsing the tool input in streaming mode
+            if self.stream_tool_parsing:
+                # The last raw arguments length, the last input and the
+                # length of its JSON dump
+                last_len, last_input, last_dump_len = last_input_objs.get(
+                    tool_id,
+                    (-1, {}, 2),
+                )
+                if len(input_str) == last_len:
+                    # No new arguments since the last chunk
+                    repaired_input = last_input
+
+                else:
+                    if len(input_str) > _REPAIR_IN_THREAD_THRESHOLD:
+                        repaired_input = await asyncio.to_thread(
+                            _json_loads_with_repair,
+                            input_str,
+                        )
+                    else:
+                        repaired_input = _json_loads_with_repair(
+                            input_str or "{}",
+                        )
+                    # If the new repaired input is shorter than one in the
+                    # last chunk, use the last one to avoid regression
+                    dump_len = len(json.dumps(repaired_input))
+                    if last_dump_len > dump_len:
+                        repaired_input, dump_len = last_input, last_dump_len
+                    last_input_objs[tool_id] = (
+                        len(input_str),
+                        repaired_input,
+                        dump_len,
+                    )
+
+            else:
+                # Otherwise, keep input as empty dict until the final chunk
+                repaired_input = {}
+
+            content_blocks.append(
+                ToolUseBlock(
+                    type="tool_use",
+                    id=tool_id,
+                    name="".join(tool_call["name_parts"]),
+                    input=repaired_input,
+                    raw_input=input_str,
+                ),
+            )
+            tool_input = repaired_input
+
+        return content_blocks, tool_input
+
     async def _parse_dashscope_generation_response(
         self,
-        start_datetime: datetime,
+        start_time: float,
         response: Union[
             GenerationResponse,
             MultiModalConversationResponse,
@@ -490,8 +783,9 @@ class DashScopeChatModel(ChatModelBase):
         blocks and usages from it.
 
         Args:
-            start_datetime (`datetime`):
-                The start datetime of the response generation.
+            start_time (`float`):
+                The start time of the response generation, measured by
+                `time.monotonic()`.
             response (
                 `Union[GenerationResponse, MultiModalConversationResponse]`
             ):
@@ -510,7 +804,7 @@ class DashScopeChatModel(ChatModelBase):
             will be stored in the metadata of the `ChatResponse`.
         """
         # Collect the content blocks from the response.
-        if response.status_code != 200:
+        if response.status_code != _HTTP_OK:
             raise RuntimeError(response)
 
         content_blocks: List[TextBlock | ToolUseBlock] = []
@@ -519,11 +813,8 @@ class DashScopeChatModel(ChatModelBase):
         message = response.output.choices[0].message
         content = message.get("content")
 
-        if response.output.choices[0].message.get("content") not in [
-            None,
-            "",
-            [],
-        ]:
+        # None, empty string and empty list are all falsy
+        if content:
             if isinstance(content, list):
                 for item in content:
                     if isinstance(item, dict) and "text" in item:
@@ -568,7 +859,7 @@ class DashScopeChatModel(ChatModelBase):
             usage = ChatUsage(
                 input_tokens=response.usage.input_tokens,
                 output_tokens=response.usage.output_tokens,
-                time=(datetime.now() - start_datetime).total_seconds(),
+                time=time.monotonic() - start_time,
                 metadata=response.usage,
             )
 
@@ -1,11 +1,11 @@
 # -*- coding: utf-8 -*-
 """The model response module."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Literal, Sequence
 
 from ._model_usage import ChatUsage
-from .._utils._common import _get_timestamp
+from .._utils._common import _add_random_suffix, _get_timestamp
 from .._utils._mixin import DictMixin
 from ..message import (
     TextBlock,
@@ -16,7 +16,7 @@ from ..message import (
 from ..types import JSONSerializableObject
 
 
-@dataclass
+@dataclass(init=False)
 class ChatResponse(DictMixin):
     """The response of chat models."""
 
@@ -24,19 +24,67 @@ class ChatResponse(DictMixin):
     """The content of the chat response, which can include text blocks,
     tool use blocks, or thinking blocks."""
 
-    id: str = field(default_factory=lambda: _get_timestamp(True))
+    id: str
     """The unique identifier formatter """
 
-    created_at: str = field(default_factory=_get_timestamp)
+    created_at: str
     """When the response was created"""
 
-    type: Literal["chat"] = field(default_factory=lambda: "chat")
+    type: Literal["chat"]
     """The type of the response, which is always 'chat'."""
 
-    usage: ChatUsage | None = field(default_factory=lambda: None)
+    usage: ChatUsage | None
     """The usage information of the chat response, if available."""
 
-    metadata: dict[str, JSONSerializableObject] | None = field(
-        default_factory=lambda: None,
-    )
+    metadata: dict[str, JSONSerializableObject] | None
     """The metadata of the chat response"""
+
+    def __init__(
+        self,
+        content: Sequence[
+            TextBlock | ToolUseBlock | ThinkingBlock | AudioBlock
+        ],
+        id: str | None = None,  # pylint: disable=redefined-builtin
+        created_at: str | None = None,
+        type: Literal["chat"] = "chat",  # pylint: disable=redefined-builtin
+        usage: ChatUsage | None = None,
+        metadata: dict[str, JSONSerializableObject] | None = None,
+    ) -> None:
+        """Initialize the chat response.
+
+        .. note:: A chat response is created for every streaming chunk, so
+         the timestamp is generated once for both `id` and `created_at`, and
+         all fields are written into the underlying dict with a single call.
+
+        Args:
+            content (`Sequence[TextBlock | ToolUseBlock | ThinkingBlock | \
+            AudioBlock]`):
+                The content of the chat response.
+            id (`str | None`, optional):
+                The unique identifier. Generated from the current timestamp
+                with a random suffix if not given.
+            created_at (`str | None`, optional):
+                When the response was created. Defaults to the current
+                timestamp.
+            type (`Literal["chat"]`, defaults to `"chat"`):
+                The type of the response, which is always 'chat'.
+            usage (`ChatUsage | None`, optional):
+                The usage information of the chat response.
+            metadata (`dict[str, JSONSerializableObject] | None`, optional):
+                The metadata of the chat response.
+        """
+        if id is None or created_at is None:
+            timestamp = _get_timestamp()
+            if id is None:
+                id = _add_random_suffix(timestamp)
+            if created_at is None:
+                created_at = timestamp
+
+        super().__init__(
+            content=content,
+            id=id,
+            created_at=created_at,
+            type=type,
+            usage=usage,
+            metadata=metadata,
+        )
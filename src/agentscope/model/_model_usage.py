@@ -1,12 +1,12 @@
 # -*- coding: utf-8 -*-
 """The model usage class in agentscope."""
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Literal, Any
 
 from .._utils._mixin import DictMixin
 
 
-@dataclass
+@dataclass(init=False)
 class ChatUsage(DictMixin):
     """The usage of a chat model API invocation."""
 
@@ -19,8 +19,42 @@ class ChatUsage(DictMixin):
     time: float
     """The time used in seconds."""
 
-    type: Literal["chat"] = field(default_factory=lambda: "chat")
+    type: Literal["chat"]
     """The type of the usage, must be `chat`."""
 
-    metadata: dict[str, Any] | None = field(default_factory=lambda: None)
+    metadata: dict[str, Any] | None
     """The metadata of the usage."""
+
+    def __init__(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        time: float,
+        type: Literal["chat"] = "chat",  # pylint: disable=redefined-builtin
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """Initialize the usage object.
+
+        .. note:: The usage is created for every streaming chunk that carries
+         usage information, so all fields are written into the underlying
+         dict with a single call instead of one `__setattr__` per field.
+
+        Args:
+            input_tokens (`int`):
+                The number of input tokens.
+            output_tokens (`int`):
+                The number of output tokens.
+            time (`float`):
+                The time used in seconds.
+            type (`Literal["chat"]`, defaults to `"chat"`):
+                The type of the usage, must be `chat`.
+            metadata (`dict[str, Any] | None`, optional):
+                The metadata of the usage.
+        """
+        super().__init__(
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            time=time,
+            type=type,
+            metadata=metadata,
+        )
@@ -1,10 +1,13 @@
 # -*- coding: utf-8 -*-
 # pylint: disable=too-many-branches
 """OpenAI Chat model class."""
-import copy
+import asyncio
+import functools
 import json
+import logging
+import time
 import warnings
-from datetime import datetime
+from types import MappingProxyType
 from typing import (
     Any,
     TYPE_CHECKING,
@@ -13,9 +16,8 @@ from typing import (
     Literal,
     Type,
 )
-from collections import OrderedDict
 
-from pydantic import BaseModel, create_model
+from pydantic import BaseModel, ConfigDict
 
 from . import ChatResponse
 from ._model_base import ChatModelBase
@@ -33,6 +35,7 @@ from ..tracing import trace_llm
 from ..types import JSONSerializableObject
 
 if TYPE_CHECKING:
+    import httpx
     from openai.types.chat import ChatCompletion
     from openai import AsyncStream
 else:
@@ -41,30 +44,132 @@ else:
 
 from openai import pydantic_function_tool
 
+_RESPONSES_STREAM_EVENTS = frozenset(
+    {
+        "response.error",
+        "response.output_text.delta",
+        "response.output_audio.delta",
+        "response.output_item.added",
+        "response.function_call_arguments.delta",
+        "response.function_call_arguments.done",
+        "response.completed",
+    },
+)
+"""The Responses API stream events that are handled, while the others (e.g.
+`response.created` and `response.in_progress`) carry nothing to parse."""
+
+_TOOL_CHOICE_MODE_MAPPING = MappingProxyType(
+    {
+        "auto": "auto",
+        "none": "none",
+        "any": "required",
+        "required": "required",
+    },
+)
+"""The tool choice modes in OpenAI API, where the deprecated `any` mode is
+mapped to `required`."""
+
+
+_STRUCTURED_OUTPUT_PARSE_INTERVAL = 8
+"""The maximum number of text updates in a structured output stream before
+the text is parsed into the structured output again."""
+
+_RESPONSES_API_ROLES = frozenset({"assistant", "system", "developer", "user"})
+"""The message roles supported by the Responses API."""
+
+_ASSISTANT_LIKE_ROLES = frozenset(
+    {"tool", "function", "tool_use", "tool-use", "agent"},
+)
+"""The legacy or custom roles that are mapped to `assistant` in the Responses
+API."""
+
+_RESPONSES_API_ROLE_MAPPING = MappingProxyType(
+    {
+        **{role: role for role in _RESPONSES_API_ROLES},
+        **{role: "assistant" for role in _ASSISTANT_LIKE_ROLES},
+    },
+)
+"""The Responses API roles of the common message roles, which are looked up
+directly without being normalized first."""
+
+_JSON_SCHEMA_TYPES = MappingProxyType(
+    {
+        "string": str,
+        "integer": int,
+        "number": float,
+        "boolean": bool,
+        "array": list,
+        "object": dict,
+    },
+)
+"""The Python types of the JSON schema types, where the others are mapped
+to `Any`."""
+
+
+class _ToolArgsBase(BaseModel):
+    """The base class of the argument models of the function tools, whose
+    core schema is only built when the tool JSON schema is generated."""
+
+    model_config = ConfigDict(defer_build=True)
+
 
 def _pydantic_model_from_schema(name: str, schema: dict) -> type[BaseModel]:
-    fields = {}
+    # The model is declared as a plain subclass instead of by
+    # `create_model`, which goes through the field definitions parsing
+    annotations = {}
+    namespace: dict[str, Any] = {
+        "__module__": __name__,
+        "__annotations__": annotations,
+    }
     required = set(schema.get("required", []))
 
     for field, spec in schema.get("properties", {}).items():
-        py_type = {
-            "string": str,
-            "integer": int,
-            "number": float,
-            "boolean": bool,
-            "array": list,
-            "object": dict,
-        }.get(spec.get("type"), Any)
+        annotations[field] = _JSON_SCHEMA_TYPES.get(spec.get("type"), Any)
+        namespace[field] = (
+            ... if field in required else spec.get("default", None)
+        )
 
-        default = ... if field in required else spec.get("default", None)
-        fields[field] = (py_type, default)
+    return type(name, (_ToolArgsBase,), namespace)
 
-    return create_model(name, **fields)
 
+@functools.lru_cache(maxsize=4096)
+def _build_pydantic_function_tool(
+    name: str,
+    description: str,
+    parameters_json: str,
+) -> Any:
+    """Build the Pydantic function tool for the Responses API. The results
+    are cached process-wide by the tool content, so identical tool schemas
+    across agents and models reuse the same tool instead of creating the
+    Pydantic model again.
 
-def _convert_tools_for_responses_api(client, tools: list[dict], cache: dict | None = None) -> list[Any]:
+    Args:
+        name (`str`):
+            The name of the function.
+        description (`str`):
+            The description of the function.
+        parameters_json (`str`):
+            The JSON string of the parameters schema, which is used as part
+            of the cache key.
+
+    Returns:
+        `Any`:
+            The Pydantic function tool, which is shared between calls and
+            must not be modified.
+    """
+    model = _pydantic_model_from_schema(
+        f"{name.title()}Args",
+        json.loads(parameters_json),
+    )
+    return pydantic_function_tool(
+        model,
+        name=name,
+        description=description,
+    )
+
+
+def _convert_tools_for_responses_api(client, tools: list[dict]) -> list[Any]:
     converted = []
-    cache = cache or {}
 
     for t in tools:
         # Leave non-function tools alone (e.g. web_search)
@@ -79,27 +184,75 @@ def _convert_tools_for_responses_api(client, tools: list[dict], cache: dict | No
             converted.append(t)
             continue
 
-        # Check cache first
-        fn_name = fn["name"]
-        if fn_name in cache:
-            converted.append(cache[fn_name])
-            continue
-
-        # Create and cache the Pydantic tool
-        model = _pydantic_model_from_schema(
-            f"{fn_name.title()}Args",
-            fn["parameters"],
+        # The cache key covers the whole schema, so the tools sharing a
+        # name but with different parameters won't collide
+        converted.append(
+            _build_pydantic_function_tool(
+                fn["name"],
+                fn.get("description", ""),
+                json.dumps(
+                    fn["parameters"],
+                    ensure_ascii=False,
+                    separators=(",", ":"),
+                ),
+            ),
         )
 
-        pydantic_tool = pydantic_function_tool(
-            model,
-            name=fn_name,
-            description=fn.get("description", ""),
+    return converted
+
+
+def _create_http_client(
+    max_connections: int | None,
+    http2: bool,
+    use_aiohttp_transport: bool = False,
+) -> "httpx.AsyncClient":
+    """Create an HTTP client with a tuned connection pool for the OpenAI
+    client, on top of the default timeout and redirect settings of the
+    OpenAI SDK.
+
+    Args:
+        max_connections (`int | None`):
+            The maximum number of concurrent connections, where a tenth of
+            them are kept alive as in the SDK defaults. If `None`, the
+            default limits of the OpenAI SDK are used.
+        http2 (`bool`):
+            Whether to enable HTTP/2.
+        use_aiohttp_transport (`bool`, defaults to `False`):
+            Whether to send the requests through an aiohttp-based transport
+            instead of the default httpx one.
+
+    Returns:
+        `httpx.AsyncClient`:
+            The HTTP client to pass to the OpenAI client.
+    """
+    import httpx
+    import openai
+
+    http_client_kwargs: dict[str, Any] = {}
+    if max_connections is not None:
+        http_client_kwargs["limits"] = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max(1, max_connections // 10),
         )
-        cache[fn_name] = pydantic_tool
-        converted.append(pydantic_tool)
 
-    return converted
+    if use_aiohttp_transport:
+        if http2:
+            raise ValueError(
+                "HTTP/2 is not supported by the aiohttp transport. Please "
+                "set either 'http2' or 'use_aiohttp_transport' to False.",
+            )
+
+        try:
+            import httpx_aiohttp  # noqa: F401  # pylint: disable=W0611
+        except ImportError as e:
+            raise ImportError(
+                "Please install the aiohttp transport by running "
+                "`pip install openai[aiohttp]`.",
+            ) from e
+
+        return openai.DefaultAioHttpClient(**http_client_kwargs)
+
+    return openai.DefaultAsyncHttpxClient(http2=http2, **http_client_kwargs)
 
 
 def _format_audio_data_for_qwen_omni(messages: list[dict]) -> None:
@@ -113,18 +266,169 @@ def _format_audio_data_for_qwen_omni(messages: list[dict]) -> None:
         messages (`list[dict]`):
             The list of message dictionaries from OpenAI formatter.
     """
-    for msg in messages:
-        if isinstance(msg.get("content"), list):
-            for block in msg["content"]:
-                if (
-                    isinstance(block, dict)
-                    and "input_audio" in block
-                    and isinstance(block["input_audio"].get("data"), str)
-                ):
-                    if not block["input_audio"]["data"].startswith("http"):
-                        block["input_audio"]["data"] = (
-                            "data:;base64," + block["input_audio"]["data"]
-                        )
+    # Text-only conversations are the common case, so only the audio blocks
+    # are walked lazily instead of checking every block in the loop body
+    audio_inputs = (
+        block["input_audio"]
+        for content in (msg.get("content") for msg in messages)
+        if isinstance(content, list)
+        for block in content
+        if isinstance(block, dict) and "input_audio" in block
+    )
+    for audio_input in audio_inputs:
+        data = audio_input.get("data")
+        # Skip URLs and the data already in data URI format
+        if (
+            isinstance(data, str)
+            and data[:4] != "http"
+            and data[:5] != "data:"
+        ):
+            audio_input["data"] = f"data:;base64,{data}"
+
+
+def _needs_responses_api_conversion(block: dict) -> bool:
+    """Check if the given content block must be converted before being
+    sent to the Responses API.
+
+    Args:
+        block (`dict`):
+            The content block in Chat Completions format.
+
+    Returns:
+        `bool`:
+            Whether the block must be converted.
+    """
+    return block.get("type") in ("text", "image_url") or (
+        "text" in block and block["text"] is None
+    )
+
+
+def _convert_block_for_responses_api(block: dict, role: str) -> dict:
+    """Convert a content block in Chat Completions format into the block
+    type of the Responses API, which uses `input_text`/`input_image` for
+    the input and `output_text` for the output.
+
+    Args:
+        block (`dict`):
+            The content block in Chat Completions format.
+        role (`str`):
+            The normalized role of the message that the block belongs to.
+
+    Returns:
+        `dict`:
+            The converted block, or the given block itself if no conversion
+            is needed.
+    """
+    if not _needs_responses_api_conversion(block):
+        return block
+
+    block_copy = block.copy()
+    # Convert legacy 'text' blocks to Responses API types
+    if block.get("type") == "text":
+        if role == "assistant":
+            block_copy["type"] = "output_text"
+        else:
+            block_copy["type"] = "input_text"
+        # Ensure 'text' is never None (Responses requires string)
+        if block_copy.get("text") is None:
+            block_copy["text"] = ""
+    elif block.get("type") == "image_url":
+        block_copy["type"] = "input_image"
+        # Responses API expects 'source' not 'image_url'
+        if "image_url" in block_copy:
+            block_copy["source"] = block_copy.pop("image_url")
+    # Defensive: make sure text fields are strings
+    elif block_copy["text"] is None:
+        block_copy["text"] = ""
+    return block_copy
+
+
+def _normalize_responses_api_role(raw_role: Any) -> str:
+    """Normalize the role of a message to the values supported by the
+    Responses API.
+
+    Args:
+        raw_role (`Any`):
+            The role of the message in Chat Completions format.
+
+    Returns:
+        `str`:
+            One of "assistant", "system", "developer" and "user".
+    """
+    if raw_role is None:
+        return "user"
+
+    # The common roles are looked up directly without lowering them
+    if isinstance(raw_role, str) and raw_role in _RESPONSES_API_ROLE_MAPPING:
+        return _RESPONSES_API_ROLE_MAPPING[raw_role]
+
+    role = str(raw_role).lower()
+    if role in _RESPONSES_API_ROLES:
+        return role
+    # Map common legacy/custom roles to a supported role
+    if role in _ASSISTANT_LIKE_ROLES:
+        return "assistant"
+    return "user"
+
+
+def _build_responses_input(messages: list[dict]) -> list[dict]:
+    """Convert the chat messages into the input of the Responses API, which
+    uses different block types than Chat Completions, i.e. `input_text`,
+    `input_image`, etc. for the input and `output_text`, `refusal`, etc. for
+    the output.
+
+    Args:
+        messages (`list[dict]`):
+            The messages in Chat Completions format.
+
+    Returns:
+        `list[dict]`:
+            The input items of the Responses API.
+    """
+    responses_input = []
+    for m in messages:
+        role = _normalize_responses_api_role(m.get("role", "user"))
+        content = m.get("content")
+
+        if isinstance(content, list):
+            # Content is structured blocks - need to convert types, and the
+            # blocks are reused as they are if none of them needs to be
+            # converted
+            content_items = content
+            if any(
+                _needs_responses_api_conversion(block) for block in content
+            ):
+                content_items = [
+                    _convert_block_for_responses_api(block, role)
+                    for block in content
+                ]
+            elif len(m) == 2 and m.get("role") == role:
+                # The message is already in the Responses API format, e.g.
+                # in the later turns of a session, so it's passed through
+                responses_input.append(m)
+                continue
+        else:
+            # Simple string content - wrap in input_text or output_text block
+            # depending on the role. Coerce None -> empty string and
+            # non-string -> str().
+            if content is None:
+                content_text = ""
+            elif isinstance(content, str):
+                content_text = content
+            else:
+                content_text = str(content)
+            content_items = [
+                {
+                    "type": "output_text"
+                    if role == "assistant"
+                    else "input_text",
+                    "text": content_text,
+                },
+            ]
+
+        responses_input.append({"role": role, "content": content_items})
+
+    return responses_input
 
 
 class OpenAIChatModel(ChatModelBase):
@@ -142,6 +446,10 @@ class OpenAIChatModel(ChatModelBase):
         client_kwargs: dict[str, JSONSerializableObject] | None = None,
         generate_kwargs: dict[str, JSONSerializableObject] | None = None,
         enable_web_search: bool = True,
+        max_connections: int | None = None,
+        http2: bool = False,
+        use_aiohttp_transport: bool = False,
+        stream_chunk_size: int = 0,
         **kwargs: Any,
     ) -> None:
         """Initialize the openai client.
@@ -183,6 +491,29 @@ class OpenAIChatModel(ChatModelBase):
                 and using the newer Responses API, `{ "type": "web_search" }`
                 will be included automatically. For legacy Chat Completions the
                 tool type is not supported and will be omitted.
+            max_connections (`int | None`, default `None`):
+                The maximum number of concurrent connections of the
+                underlying HTTP connection pool. Tune it to the concurrency
+                of the agent workload to avoid pool timeouts. If `None`
+                (and `http2` is `False`), the default HTTP client of the
+                OpenAI SDK is used. Ignored if `http_client` is given in
+                `client_kwargs`.
+            http2 (`bool`, default `False`):
+                Whether to enable HTTP/2 in the underlying HTTP client,
+                which requires the `h2` package (`pip install httpx[http2]`).
+            use_aiohttp_transport (`bool`, default `False`):
+                Whether to send the requests through an aiohttp-based
+                transport instead of the default httpx one, which scales
+                better under many concurrent requests, e.g. when fanning out
+                a lot of agents in parallel. Requires the `aiohttp` extra of
+                the OpenAI SDK (`pip install openai[aiohttp]`). Ignored if
+                `http_client` is given in `client_kwargs`.
+            stream_chunk_size (`int`, default `0`):
+                The minimum number of characters received in the streaming
+                chunks before a new response is yielded. The chunks in
+                between are coalesced into one response, while a new tool
+                call, the usage and the end of the stream always yield. Every
+                chunk is yielded when set to 0.
             **kwargs (`Any`):
                 Additional keyword arguments.
         """
@@ -219,25 +550,124 @@ class OpenAIChatModel(ChatModelBase):
                 "Invalid client_type. Supported values: 'openai', 'azure'.",
             )
 
+        client_kwargs = dict(client_kwargs or {})
+        if (
+            max_connections is not None or http2 or use_aiohttp_transport
+        ) and "http_client" not in client_kwargs:
+            client_kwargs["http_client"] = _create_http_client(
+                max_connections,
+                http2,
+                use_aiohttp_transport,
+            )
+
         if client_type == "azure":
             self.client = openai.AsyncAzureOpenAI(
                 api_key=api_key,
                 organization=organization,
-                **(client_kwargs or {}),
+                **client_kwargs,
             )
         else:
             self.client = openai.AsyncClient(
                 api_key=api_key,
                 organization=organization,
-                **(client_kwargs or {}),
+                **client_kwargs,
             )
 
+        # The model family and the client capabilities are fixed after
+        # construction, so we don't check them again on every call
+        self._is_qwen_omni = "omni" in model_name.lower()
+        self._has_responses_api = hasattr(self.client, "responses")
+
         self.reasoning_effort = reasoning_effort
         self.stream_tool_parsing = stream_tool_parsing
+        self.stream_chunk_size = stream_chunk_size
         self.generate_kwargs = generate_kwargs or {}
         self.enable_web_search = enable_web_search
-        self._pydantic_tools_cache: dict[str,
-                                         Any] = {}  # Cache converted tools
+
+    async def aclose(self) -> None:
+        """Close the underlying OpenAI client and its HTTP connections."""
+        await self.client.close()
+
+    async def batch_call(
+        self,
+        requests: list[dict[str, Any]],
+        max_concurrency: int = 8,
+        requests_per_minute: int | None = None,
+    ) -> list[ChatResponse | list[ChatResponse] | Exception]:
+        """Run many independent requests concurrently, with at most
+        `max_concurrency` of them in flight at the same time to avoid
+        hitting the rate limits or exhausting the connection pool.
+
+        .. note:: The rate limited requests are retried with exponential
+         backoff by the OpenAI client, which can be configured by
+         `max_retries` in `client_kwargs`. Set `max_connections` to at least
+         `max_concurrency` so that the requests don't wait for a free
+         connection.
+
+        Args:
+            requests (`list[dict[str, Any]]`):
+                The keyword arguments of each request, e.g.
+                `{"messages": [...], "tools": [...]}`, which are passed to
+                `__call__`.
+            max_concurrency (`int`, default `8`):
+                The maximum number of concurrent requests.
+            requests_per_minute (`int | None`, default `None`):
+                The rate limit of the requests. If given, the requests are
+                started evenly spaced at this rate, so that a large batch
+                doesn't burst into the rate limit of the provider.
+
+        Returns:
+            `list[ChatResponse | list[ChatResponse] | Exception]`:
+                The responses in the same order as the requests. For a
+                streaming model, the stream is consumed and its final
+                response is returned. A failed request gives its exception
+                instead of failing the whole batch.
+        """
+        if max_concurrency <= 0:
+            raise ValueError(
+                "max_concurrency must be a positive integer, got "
+                f"{max_concurrency}.",
+            )
+
+        if requests_per_minute is not None and requests_per_minute <= 0:
+            raise ValueError(
+                "requests_per_minute must be a positive integer, got "
+                f"{requests_per_minute}.",
+            )
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        interval = 60 / requests_per_minute if requests_per_minute else 0.0
+        next_start = time.monotonic()
+
+        async def _call_one(
+            request: dict[str, Any],
+        ) -> ChatResponse | list[ChatResponse]:
+            nonlocal next_start
+            async with semaphore:
+                if interval:
+                    # Reserve the next start time before sleeping, so that
+                    # the concurrent requests are spaced out in order
+                    now = time.monotonic()
+                    delay = next_start - now
+                    next_start = max(now, next_start) + interval
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+
+                res = await self(**request)
+                if not isinstance(res, AsyncGenerator):
+                    return res
+
+                # Consume the stream within the semaphore, since the request
+                # is in flight until the stream ends
+                last_res = None
+                async for last_res in res:
+                    pass
+                return last_res
+
+        return await asyncio.gather(
+            *(_call_one(request) for request in requests),
+            return_exceptions=True,
+        )
 
     @trace_llm
     async def __call__(
@@ -247,7 +677,9 @@ class OpenAIChatModel(ChatModelBase):
         tool_choice: Literal["auto", "none", "required"] | str | None = None,
         structured_model: Type[BaseModel] | None = None,
         **kwargs: Any,
-    ) -> ChatResponse | AsyncGenerator[ChatResponse, None]:
+    ) -> (
+        ChatResponse | list[ChatResponse] | AsyncGenerator[ChatResponse, None]
+    ):
         """Get the response from OpenAI chat completions API by the given
         arguments.
 
@@ -283,10 +715,14 @@ class OpenAIChatModel(ChatModelBase):
                 The keyword arguments for OpenAI chat completions API,
                 e.g. `temperature`, `max_tokens`, `top_p`, etc. Please
                 refer to the OpenAI API documentation for more details.
+                With `n` > 1 in non-streaming mode, multiple choices are
+                generated in one request and returned as a list.
 
         Returns:
-            `ChatResponse | AsyncGenerator[ChatResponse, None]`:
-                The response from the OpenAI chat completions API.
+            `ChatResponse | list[ChatResponse] | AsyncGenerator[ChatResponse, \
+            None]`:
+                The response from the OpenAI chat completions API, or a list
+                of responses, one for each choice, when `n` > 1.
         """
 
         # checking messages
@@ -295,14 +731,17 @@ class OpenAIChatModel(ChatModelBase):
                 "OpenAI `messages` field expected type `list`, "
                 f"got `{type(messages)}` instead.",
             )
-        if not all("role" in msg and "content" in msg for msg in messages):
-            raise ValueError(
-                "Each message in the 'messages' list must contain a 'role' "
-                "and 'content' key for OpenAI API.",
-            )
+        # A plain loop instead of all() over a generator, which avoids the
+        # generator frame for every message in long conversations
+        for msg in messages:
+            if "role" not in msg or "content" not in msg:
+                raise ValueError(
+                    "Each message in the 'messages' list must contain a "
+                    "'role' and 'content' key for OpenAI API.",
+                )
 
         # Qwen-omni requires different base64 audio format from openai
-        if "omni" in self.model_name.lower():
+        if self._is_qwen_omni:
             _format_audio_data_for_qwen_omni(messages)
 
         # Decide whether to use Responses API (when web_search is enabled, or
@@ -313,80 +752,28 @@ class OpenAIChatModel(ChatModelBase):
         #         for t in tools
         #     )
         # )
+        # The number of choices to generate. The choices of a stream are
+        # interleaved, which the stream parser doesn't support
+        n = kwargs.get("n", self.generate_kwargs.get("n")) or 1
+        if n > 1 and self.stream:
+            raise ValueError(
+                "Generating multiple choices with `n` > 1 is only supported "
+                "when `stream` is False.",
+            )
+
+        # The Responses API doesn't support generating multiple choices
         use_responses_api = (
             self.enable_web_search
             and not structured_model
-            and hasattr(self.client, "responses")
+            and self._has_responses_api
+            and n == 1
         )
 
-        start_datetime = datetime.now()
+        start_time = time.monotonic()
 
         if use_responses_api:
             try:
-                # Convert chat messages to responses input blocks
-                # The Responses API uses different block types than Chat Completions:
-                # - Input: 'input_text', 'input_image', etc.
-                # - Output: 'output_text', 'refusal', etc.
-                responses_input = []
-                for m in messages:
-                    # Normalize role to Responses API supported values
-                    raw_role = m.get("role", "user")
-                    if raw_role is None:
-                        raw_role = "user"
-                    role = str(raw_role).lower()
-                    if role not in ("assistant", "system", "developer", "user"):
-                        # Map common legacy/custom roles to a supported role
-                        if role in ("tool", "function", "tool_use", "tool-use", "agent"):
-                            role = "assistant"
-                        else:
-                            role = "user"
-
-                    if isinstance(m.get("content"), list):
-                        # Content is structured blocks - need to convert types
-                        content_items = []
-                        for block in m["content"]:
-                            block_copy = {**block}
-                            # Convert legacy 'text' blocks to Responses API types
-                            if block.get("type") == "text":
-                                if role == "assistant":
-                                    block_copy["type"] = "output_text"
-                                else:
-                                    block_copy["type"] = "input_text"
-                                # Ensure 'text' is never None (Responses requires string)
-                                if block_copy.get("text") is None:
-                                    block_copy["text"] = ""
-                            elif block.get("type") == "image_url":
-                                block_copy["type"] = "input_image"
-                                # Responses API expects 'source' not 'image_url'
-                                if "image_url" in block_copy:
-                                    block_copy["source"] = block_copy.pop(
-                                        "image_url")
-                            else:
-                                # Defensive: make sure text fields are strings
-                                if "text" in block_copy and block_copy["text"] is None:
-                                    block_copy["text"] = ""
-                            content_items.append(block_copy)
-                    else:
-                        # Simple string content - wrap in input_text or
-                        # output_text block depending on the role. Coerce
-                        # None -> empty string and non-string -> str().
-                        content_type = "output_text" if role == "assistant" else "input_text"
-                        raw = m.get("content")
-                        if raw is None:
-                            content_text = ""
-                        elif isinstance(raw, str):
-                            content_text = raw
-                        else:
-                            content_text = str(raw)
-                        content_items = [
-                            {"type": content_type, "text": content_text}]
-
-                    responses_input.append(
-                        {
-                            "role": role,
-                            "content": content_items,
-                        },
-                    )
+                responses_input = _build_responses_input(messages)
 
                 tools_to_send: list[Any] = []
                 if tools:
@@ -404,16 +791,19 @@ class OpenAIChatModel(ChatModelBase):
                 tools_to_send = _convert_tools_for_responses_api(
                     self.client,
                     tools_to_send,
-                    cache=self._pydantic_tools_cache,)
+                )
 
                 resp_kwargs = {
                     "model": self.model_name,
                     "input": responses_input,
-                    **self.generate_kwargs,
-                    **kwargs,
                 }
-                if self.reasoning_effort and "reasoning_effort" not in resp_kwargs:
-                    resp_kwargs["reasoning_effort"] = self.reasoning_effort
+                resp_kwargs.update(self.generate_kwargs)
+                resp_kwargs.update(kwargs)
+                if self.reasoning_effort:
+                    resp_kwargs.setdefault(
+                        "reasoning_effort",
+                        self.reasoning_effort,
+                    )
                 if tools_to_send:
                     resp_kwargs["tools"] = tools_to_send
                 if tool_choice:
@@ -423,19 +813,22 @@ class OpenAIChatModel(ChatModelBase):
                         responses_api=True,
                     )
 
-                logger.debug(
-                    "Using Responses API (web_search enabled) model=%s", self.model_name)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Using Responses API (web_search enabled) model=%s",
+                        self.model_name,
+                    )
                 if self.stream:
                     # responses.stream returns a manager directly (not awaited)
                     stream = self.client.responses.stream(**resp_kwargs)
                     return self._parse_openai_responses_stream(
-                        start_datetime,
+                        start_time,
                         stream,
                     )
                 else:
                     resp = await self.client.responses.create(**resp_kwargs)
                     return self._parse_openai_responses_response(
-                        start_datetime,
+                        start_time,
                         resp,
                     )
             except Exception as e:  # noqa: BLE001
@@ -446,23 +839,28 @@ class OpenAIChatModel(ChatModelBase):
                 # fall through to chat completions with original messages format
 
         # Legacy Chat Completions path
-        logger.debug("Using Chat Completions API model=%s", self.model_name)
-        kwargs = {
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Using Chat Completions API model=%s",
+                self.model_name,
+            )
+        request_kwargs = {
             "model": self.model_name,
             "messages": messages,
             "stream": self.stream,
-            **self.generate_kwargs,
-            **kwargs,
         }
-        if self.reasoning_effort and "reasoning_effort" not in kwargs:
-            kwargs["reasoning_effort"] = self.reasoning_effort
+        request_kwargs.update(self.generate_kwargs)
+        request_kwargs.update(kwargs)
+        if self.reasoning_effort:
+            request_kwargs.setdefault(
+                "reasoning_effort",
+                self.reasoning_effort,
+            )
 
-        tools_to_send: list[dict] = []
+        # Do NOT append web_search here (unsupported in chat completions), so
+        # the given tools are formatted as they are without being copied
         if tools:
-            tools_to_send.extend(tools)
-        # Do NOT append web_search here (unsupported in chat completions)
-        if tools_to_send:
-            kwargs["tools"] = self._format_tools_json_schemas(tools_to_send)
+            request_kwargs["tools"] = self._format_tools_json_schemas(tools)
         if tool_choice:
             # Handle deprecated "any" option with warning
             if tool_choice == "any":
@@ -473,41 +871,47 @@ class OpenAIChatModel(ChatModelBase):
                 )
                 tool_choice = "required"
             self._validate_tool_choice(tool_choice, tools)
-            kwargs["tool_choice"] = self._format_tool_choice(
+            request_kwargs["tool_choice"] = self._format_tool_choice(
                 tool_choice, responses_api=False,)
 
         if self.stream:
-            kwargs["stream_options"] = {"include_usage": True}
+            request_kwargs["stream_options"] = {"include_usage": True}
 
         if structured_model:
             if tools or tool_choice:
                 logger.warning(
                     "structured_model is provided. Both 'tools' and 'tool_choice' will be ignored.",
                 )
-            kwargs.pop("stream", None)
-            kwargs.pop("tools", None)
-            kwargs.pop("tool_choice", None)
-            kwargs["response_format"] = structured_model
+            request_kwargs.pop("stream", None)
+            request_kwargs.pop("tools", None)
+            request_kwargs.pop("tool_choice", None)
+            request_kwargs["response_format"] = structured_model
             if not self.stream:
-                response = await self.client.chat.completions.parse(**kwargs)
+                response = await self.client.chat.completions.parse(
+                    **request_kwargs,
+                )
             else:
-                response = self.client.chat.completions.stream(**kwargs)
+                response = self.client.chat.completions.stream(
+                    **request_kwargs,
+                )
                 return self._parse_openai_stream_response(
-                    start_datetime,
+                    start_time,
                     response,
                     structured_model,
                 )
         else:
-            response = await self.client.chat.completions.create(**kwargs)
+            response = await self.client.chat.completions.create(
+                **request_kwargs,
+            )
 
         if self.stream:
             return self._parse_openai_stream_response(
-                start_datetime,
+                start_time,
                 response,
                 structured_model,
             )
         return self._parse_openai_completion_response(
-            start_datetime,
+            start_time,
             response,
             structured_model,
         )
@@ -515,7 +919,7 @@ class OpenAIChatModel(ChatModelBase):
     # pylint: disable=too-many-statements
     async def _parse_openai_stream_response(
         self,
-        start_datetime: datetime,
+        start_time: float,
         response: AsyncStream,
         structured_model: Type[BaseModel] | None = None,
     ) -> AsyncGenerator[ChatResponse, None]:
@@ -523,8 +927,9 @@ class OpenAIChatModel(ChatModelBase):
          blocks and usages from it and yield ChatResponse objects.
 
         Args:
-            start_datetime (`datetime`):
-                The start datetime of the response generation.
+            start_time (`float`):
+                The start time of the response generation, measured by
+                `time.monotonic()`.
             response (`AsyncStream`):
                 OpenAI AsyncStream object to parse.
             structured_model (`Type[BaseModel] | None`, default `None`):
@@ -542,119 +947,216 @@ class OpenAIChatModel(ChatModelBase):
             will be stored in the metadata of the `ChatResponse`.
         """
         usage, res = None, None
-        text = ""
-        thinking = ""
-        audio = ""
-        tool_calls = OrderedDict()
-        last_input_objs = {}  # Store last input_obj for each tool_call
+        # The streamed fragments are collected and only joined when the
+        # corresponding block is re-created, instead of being concatenated
+        # chunk by chunk
+        text_parts: list[str] = []
+        thinking_parts: list[str] = []
+        audio_parts: list[str] = []
+        # The tool calls by their indices, which are small integers counting
+        # from 0, so a list is enough and keeps them in the order of indices
+        tool_calls: list[dict | None] = []
+        # The raw arguments length, input and input JSON length of each tool
+        # call when its block was last built
+        last_input_objs: dict[int, tuple[int, dict, int]] = {}
         metadata: dict | None = None
         contents: List[
             TextBlock | ToolUseBlock | ThinkingBlock | AudioBlock
         ] = []
         last_contents = None
 
+        # The latest blocks. A block is only re-created when its content
+        # changes in a chunk, and the yielded blocks are never modified, so
+        # the unchanged blocks are shared between the yielded responses.
+        thinking_block: ThinkingBlock | None = None
+        audio_block: AudioBlock | None = None
+        text_block: TextBlock | None = None
+        tool_blocks: dict[int, ToolUseBlock] = {}
+
+        # The audio media type is fixed during the stream
+        audio_format = self.generate_kwargs.get("audio", {}).get(
+            "format",
+            "wav",
+        )
+        audio_media_type = f"audio/{audio_format}"
+
+        # Whether the thinking, audio and text changed since the last yield,
+        # and the indices of the tool calls updated since the last yield. The
+        # changed blocks are only re-created right before yielding.
+        thinking_dirty = audio_dirty = text_dirty = False
+        updated_indices: set[int] = set()
+        # The number of characters received since the last yield
+        pending_chars = 0
+        # The number of text updates not parsed into the structured output
+        # yet, and whether a JSON object is closed in them
+        pending_structured = 0
+        structured_boundary = False
+
         async with response as stream:
-            async for item in stream:
-                if structured_model:
-                    if item.type != "chunk":
-                        continue
-                    chunk = item.chunk
+            chunks = aiter(stream)
+            while True:
+                item = await anext(chunks, None)
+                if item is None:
+                    # The stream is closed, flush the coalesced changes that
+                    # are not yielded yet
+                    if not (
+                        thinking_dirty
+                        or audio_dirty
+                        or text_dirty
+                        or updated_indices
+                        or pending_structured
+                    ):
+                        break
+
                 else:
-                    chunk = item
-
-                if chunk.usage:
-                    usage = ChatUsage(
-                        input_tokens=chunk.usage.prompt_tokens,
-                        output_tokens=chunk.usage.completion_tokens,
-                        time=(datetime.now() - start_datetime).total_seconds(),
-                        metadata=chunk.usage,
-                    )
+                    if structured_model:
+                        if item.type != "chunk":
+                            continue
+                        chunk = item.chunk
+                    else:
+                        chunk = item
 
-                if not chunk.choices:
-                    if usage and contents:
-                        res = ChatResponse(
-                            content=contents,
-                            usage=usage,
-                            metadata=metadata,
+                    if chunk.usage:
+                        usage = ChatUsage(
+                            input_tokens=chunk.usage.prompt_tokens,
+                            output_tokens=chunk.usage.completion_tokens,
+                            time=time.monotonic() - start_time,
+                            metadata=chunk.usage,
                         )
-                        yield res
-                    continue
-
-                choice = chunk.choices[0]
 
-                thinking += (
-                    getattr(choice.delta, "reasoning_content", None) or ""
-                )
-                text += getattr(choice.delta, "content", None) or ""
+                    if not chunk.choices:
+                        # Yield the latest contents with the usage
+                        if not usage:
+                            continue
 
-                if (
-                    hasattr(choice.delta, "audio")
-                    and "data" in choice.delta.audio
-                ):
-                    audio += choice.delta.audio["data"]
-                if (
-                    hasattr(choice.delta, "audio")
-                    and "transcript" in choice.delta.audio
-                ):
-                    text += choice.delta.audio["transcript"]
+                    else:
+                        # The delta is read once. It may be None, and the
+                        # provider-specific fields, e.g. `reasoning_content`
+                        # and `audio`, may be missing, so the fields are read
+                        # with defaults
+                        delta = chunk.choices[0].delta
+
+                        delta_thinking = (
+                            getattr(delta, "reasoning_content", None) or ""
+                        )
+                        delta_text = getattr(delta, "content", None) or ""
+                        delta_audio = ""
+
+                        # The audio may be None in the chunks without audio
+                        # output
+                        audio_delta = getattr(delta, "audio", None)
+                        if audio_delta:
+                            if "data" in audio_delta:
+                                delta_audio = audio_delta["data"]
+                            if "transcript" in audio_delta:
+                                delta_text += audio_delta["transcript"]
+
+                        if delta_thinking:
+                            thinking_parts.append(delta_thinking)
+                            thinking_dirty = True
+                        if delta_text:
+                            text_parts.append(delta_text)
+                            text_dirty = True
+                            if structured_model and "}" in delta_text:
+                                structured_boundary = True
+                        if delta_audio:
+                            audio_parts.append(delta_audio)
+                            audio_dirty = True
+                        pending_chars += (
+                            len(delta_thinking)
+                            + len(delta_text)
+                            + len(delta_audio)
+                        )
 
-                for tool_call in (
-                    getattr(choice.delta, "tool_calls", None) or []
-                ):
-                    if tool_call.index in tool_calls:
-                        if tool_call.function.arguments is not None:
-                            tool_calls[tool_call.index][
-                                "input"
-                            ] += tool_call.function.arguments
+                        # Whether a new tool call starts in this chunk, which
+                        # means the previous one is completed
+                        new_tool_call = False
+                        for tool_call in (
+                            getattr(delta, "tool_calls", None) or []
+                        ):
+                            # The arguments fragments are collected and
+                            # only joined when the block is re-created
+                            arguments = tool_call.function.arguments
+                            index = tool_call.index
+                            if index >= len(tool_calls):
+                                tool_calls.extend(
+                                    [None] * (index - len(tool_calls) + 1),
+                                )
+                            if tool_calls[index] is None:
+                                tool_calls[index] = {
+                                    "type": "tool_use",
+                                    "id": tool_call.id,
+                                    "name": tool_call.function.name,
+                                    "arg_parts": [],
+                                }
+                                new_tool_call = True
+                            if arguments:
+                                tool_calls[index]["arg_parts"].append(
+                                    arguments,
+                                )
+                            updated_indices.add(index)
+                            pending_chars += len(arguments or "")
+
+                        # Coalesce the chunks until enough characters are
+                        # received, a new tool call starts or the usage
+                        # arrives
+                        if (
+                            self.stream_chunk_size > 0
+                            and pending_chars < self.stream_chunk_size
+                            and not new_tool_call
+                            and not chunk.usage
+                        ):
+                            continue
 
-                    else:
-                        tool_calls[tool_call.index] = {
-                            "type": "tool_use",
-                            "id": tool_call.id,
-                            "name": tool_call.function.name,
-                            "input": tool_call.function.arguments or "",
-                        }
-
-                contents = []
-
-                if thinking:
-                    contents.append(
-                        ThinkingBlock(
-                            type="thinking",
-                            thinking=thinking,
-                        ),
+                if thinking_dirty:
+                    thinking_block = ThinkingBlock(
+                        type="thinking",
+                        thinking="".join(thinking_parts),
                     )
 
-                if audio:
-                    media_type = self.generate_kwargs.get("audio", {}).get(
-                        "format",
-                        "wav",
-                    )
-                    contents.append(
-                        AudioBlock(
-                            type="audio",
-                            source=Base64Source(
-                                data=audio,
-                                media_type=f"audio/{media_type}",
-                                type="base64",
-                            ),
+                if audio_dirty:
+                    audio_block = AudioBlock(
+                        type="audio",
+                        source=Base64Source(
+                            data="".join(audio_parts),
+                            media_type=audio_media_type,
+                            type="base64",
                         ),
                     )
 
-                if text:
-                    contents.append(
-                        TextBlock(
-                            type="text",
-                            text=text,
-                        ),
+                if text_dirty:
+                    text = "".join(text_parts)
+                    text_block = TextBlock(
+                        type="text",
+                        text=text,
                     )
 
                     if structured_model:
-                        metadata = _json_loads_with_repair(text)
-
-                for tool_call in tool_calls.values():
-                    input_str = tool_call["input"]
-                    tool_id = tool_call["id"]
+                        pending_structured += 1
+
+                # Repairing the partial JSON text gets costly for long
+                # structured outputs, so it's only re-parsed when an object
+                # is closed, every few updates, and at the end of the stream
+                if pending_structured and (
+                    item is None
+                    or structured_boundary
+                    or pending_structured >= _STRUCTURED_OUTPUT_PARSE_INTERVAL
+                ):
+                    metadata = _json_loads_with_repair(text)
+                    pending_structured = 0
+                    structured_boundary = False
+
+                # Only the tool calls with new arguments are re-parsed, and
+                # the others keep their last blocks
+                for index in updated_indices:
+                    tool_call = tool_calls[index]
+                    input_str = "".join(tool_call["arg_parts"])
+                    last_len, last_input, last_dump_len = last_input_objs.get(
+                        index,
+                        (-1, {}, 2),
+                    )
+                    if len(input_str) == last_len:
+                        continue
 
                     # If parsing the tool input in streaming mode
                     if self.stream_tool_parsing:
@@ -663,28 +1165,45 @@ class OpenAIChatModel(ChatModelBase):
                         )
                         # If the new repaired input is shorter than one in the
                         # last chunk, use the last one to avoid regression
-                        last_input = last_input_objs.get(tool_id, {})
-                        if len(json.dumps(last_input)) > len(
-                            json.dumps(repaired_input),
-                        ):
+                        dump_len = len(json.dumps(repaired_input))
+                        if last_dump_len > dump_len:
                             repaired_input = last_input
-                        last_input_objs[tool_id] = repaired_input
+                            dump_len = last_dump_len
 
                     else:
                         # Otherwise, keep input as empty dict until the final
                         # chunk
-                        repaired_input = {}
-
-                    contents.append(
-                        ToolUseBlock(
-                            type=tool_call["type"],
-                            id=tool_id,
-                            name=tool_call["name"],
-                            input=repaired_input,
-                            raw_input=input_str,
-                        ),
+                        repaired_input, dump_len = {}, 2
+                    last_input_objs[index] = (
+                        len(input_str),
+                        repaired_input,
+                        dump_len,
+                    )
+
+                    tool_blocks[index] = ToolUseBlock(
+                        type=tool_call["type"],
+                        id=tool_call["id"],
+                        name=tool_call["name"],
+                        input=repaired_input,
+                        raw_input=input_str,
                     )
 
+                thinking_dirty = audio_dirty = text_dirty = False
+                updated_indices.clear()
+                pending_chars = 0
+
+                contents = [
+                    block
+                    for block in (thinking_block, audio_block, text_block)
+                    if block is not None
+                ]
+                # Keep the tool use blocks in the order of their indices
+                contents.extend(
+                    tool_blocks[index]
+                    for index, tool_call in enumerate(tool_calls)
+                    if tool_call is not None
+                )
+
                 if contents:
                     res = ChatResponse(
                         content=contents,
@@ -692,39 +1211,54 @@ class OpenAIChatModel(ChatModelBase):
                         metadata=metadata,
                     )
                     yield res
-                    last_contents = copy.deepcopy(contents)
+                    last_contents = contents
+
+                if item is None:
+                    break
 
         # If stream_tool_parsing is False, yield last contents
         if not self.stream_tool_parsing and tool_calls and last_contents:
             metadata = None
-            # Update tool use blocks in last_contents inplace
+            # The yielded blocks are shared, so the tool use blocks with the
+            # parsed input are created as new blocks
+            final_contents = []
             for block in last_contents:
                 if block.get("type") == "tool_use":
-                    block["input"] = input_obj = _json_loads_with_repair(
+                    input_obj = _json_loads_with_repair(
                         str(block.get("raw_input") or "{}"),
                     )
+                    block = ToolUseBlock(
+                        type="tool_use",
+                        id=block["id"],
+                        name=block["name"],
+                        input=input_obj,
+                        raw_input=block.get("raw_input"),
+                    )
 
                     if structured_model:
                         metadata = input_obj
 
+                final_contents.append(block)
+
             yield ChatResponse(
-                content=last_contents,
+                content=final_contents,
                 usage=usage,
                 metadata=metadata,
             )
 
     def _parse_openai_completion_response(
         self,
-        start_datetime: datetime,
+        start_time: float,
         response: ChatCompletion,
         structured_model: Type[BaseModel] | None = None,
-    ) -> ChatResponse:
+    ) -> ChatResponse | list[ChatResponse]:
         """Given an OpenAI chat completion response object, extract the content
             blocks and usages from it.
 
         Args:
-            start_datetime (`datetime`):
-                The start datetime of the response generation.
+            start_time (`float`):
+                The start time of the response generation, measured by
+                `time.monotonic()`.
             response (`ChatCompletion`):
                 OpenAI ChatCompletion object to parse.
             structured_model (`Type[BaseModel] | None`, default `None`):
@@ -732,93 +1266,140 @@ class OpenAIChatModel(ChatModelBase):
                 for the model's output.
 
         Returns:
-            ChatResponse (`ChatResponse`):
-                A ChatResponse object containing the content blocks and usage.
+            `ChatResponse | list[ChatResponse]`:
+                A ChatResponse object containing the content blocks and usage,
+                or a list of ChatResponse objects, one for each choice, if
+                multiple choices are generated with `n` > 1. The usage of the
+                whole request is shared by all of them.
 
         .. note::
             If `structured_model` is not `None`, the expected structured output
             will be stored in the metadata of the `ChatResponse`.
         """
+        usage = None
+        if response.usage:
+            usage = ChatUsage(
+                input_tokens=response.usage.prompt_tokens,
+                output_tokens=response.usage.completion_tokens,
+                time=time.monotonic() - start_time,
+                metadata=response.usage,
+            )
+
+        if len(response.choices) > 1:
+            return [
+                ChatResponse(
+                    content=content_blocks,
+                    usage=usage,
+                    metadata=metadata,
+                )
+                for content_blocks, metadata in (
+                    self._parse_openai_completion_message(
+                        choice.message,
+                        structured_model,
+                    )
+                    for choice in response.choices
+                )
+            ]
+
+        content_blocks, metadata = [], None
+        if response.choices:
+            content_blocks, metadata = self._parse_openai_completion_message(
+                response.choices[0].message,
+                structured_model,
+            )
+
+        parsed_response = ChatResponse(
+            content=content_blocks,
+            usage=usage,
+            metadata=metadata,
+        )
+
+        return parsed_response
+
+    def _parse_openai_completion_message(
+        self,
+        message: Any,
+        structured_model: Type[BaseModel] | None = None,
+    ) -> tuple[
+        List[TextBlock | ToolUseBlock | ThinkingBlock | AudioBlock],
+        dict | None,
+    ]:
+        """Extract the content blocks and the structured output from the
+        message of a chat completion choice.
+
+        Args:
+            message (`Any`):
+                The message of an OpenAI chat completion choice.
+            structured_model (`Type[BaseModel] | None`, default `None`):
+                A Pydantic BaseModel class that defines the expected structure
+                for the model's output.
+
+        Returns:
+            `tuple[list, dict | None]`:
+                The content blocks, and the structured output if
+                `structured_model` is given.
+        """
         content_blocks: List[
             TextBlock | ToolUseBlock | ThinkingBlock | AudioBlock
         ] = []
         metadata: dict | None = None
 
-        if response.choices:
-            choice = response.choices[0]
-            if (
-                hasattr(choice.message, "reasoning_content")
-                and choice.message.reasoning_content is not None
-            ):
-                content_blocks.append(
-                    ThinkingBlock(
-                        type="thinking",
-                        thinking=response.choices[0].message.reasoning_content,
+        reasoning_content = getattr(message, "reasoning_content", None)
+        if reasoning_content is not None:
+            content_blocks.append(
+                ThinkingBlock(
+                    type="thinking",
+                    thinking=reasoning_content,
+                ),
+            )
+
+        if message.content:
+            content_blocks.append(
+                TextBlock(
+                    type="text",
+                    text=message.content,
+                ),
+            )
+        if message.audio:
+            media_type = self.generate_kwargs.get("audio", {}).get(
+                "format",
+                "mp3",
+            )
+            content_blocks.append(
+                AudioBlock(
+                    type="audio",
+                    source=Base64Source(
+                        data=message.audio.data,
+                        media_type=f"audio/{media_type}",
+                        type="base64",
                     ),
-                )
+                ),
+            )
 
-            if choice.message.content:
+            if message.audio.transcript:
                 content_blocks.append(
                     TextBlock(
                         type="text",
-                        text=response.choices[0].message.content,
-                    ),
-                )
-            if choice.message.audio:
-                media_type = self.generate_kwargs.get("audio", {}).get(
-                    "format",
-                    "mp3",
-                )
-                content_blocks.append(
-                    AudioBlock(
-                        type="audio",
-                        source=Base64Source(
-                            data=choice.message.audio.data,
-                            media_type=f"audio/{media_type}",
-                            type="base64",
-                        ),
+                        text=message.audio.transcript,
                     ),
                 )
 
-                if choice.message.audio.transcript:
-                    content_blocks.append(
-                        TextBlock(
-                            type="text",
-                            text=choice.message.audio.transcript,
-                        ),
-                    )
-
-            for tool_call in choice.message.tool_calls or []:
-                content_blocks.append(
-                    ToolUseBlock(
-                        type="tool_use",
-                        id=tool_call.id,
-                        name=tool_call.function.name,
-                        input=_json_loads_with_repair(
-                            tool_call.function.arguments,
-                        ),
+        for tool_call in message.tool_calls or []:
+            content_blocks.append(
+                ToolUseBlock(
+                    type="tool_use",
+                    id=tool_call.id,
+                    name=tool_call.function.name,
+                    input=_json_loads_with_repair(
+                        tool_call.function.arguments,
                     ),
-                )
-
-            if structured_model:
-                metadata = choice.message.parsed.model_dump()
-
-        usage = None
-        if response.usage:
-            usage = ChatUsage(
-                input_tokens=response.usage.prompt_tokens,
-                output_tokens=response.usage.completion_tokens,
-                time=(datetime.now() - start_datetime).total_seconds(),
-                metadata=response.usage,
+                ),
             )
 
-        parsed_response = ChatResponse(
-            content=content_blocks,
-            usage=usage,
-            metadata=metadata,
-        )
+        if structured_model:
+            metadata = message.parsed.model_dump()
 
-        return parsed_response
+        return content_blocks, metadata
 
     def _format_tools_json_schemas(
         self,
@@ -827,8 +1408,8 @@ class OpenAIChatModel(ChatModelBase):
         """Format the tools JSON schemas to the OpenAI format."""
         return schemas
 
+    @staticmethod
     def _format_tool_choice(
-        self,
         tool_choice: Literal["auto", "none", "any", "required"] | str | None,
         responses_api: bool = False,
     ) -> str | dict | None:
@@ -849,14 +1430,11 @@ class OpenAIChatModel(ChatModelBase):
         if tool_choice is None:
             return None
 
-        mode_mapping = {
-            "auto": "auto",
-            "none": "none",
-            "required": "required",
-        }
-        if tool_choice in mode_mapping:
-            return mode_mapping[tool_choice]
+        if tool_choice in _TOOL_CHOICE_MODE_MAPPING:
+            return _TOOL_CHOICE_MODE_MAPPING[tool_choice]
         if isinstance(tool_choice, str):
+            # The dicts are built for every call rather than shared, since
+            # they end up in the request arguments
             if tool_choice == "web_search" and responses_api:
                 return {"type": "web_search"}
             return {"type": "function", "function": {"name": tool_choice}}
@@ -864,162 +1442,172 @@ class OpenAIChatModel(ChatModelBase):
 
     async def _parse_openai_responses_stream(
         self,
-        start_datetime: datetime,
+        start_time: float,
         response: Any,
     ) -> AsyncGenerator[ChatResponse, None]:
         """Parse streaming Responses API output into ChatResponse objects."""
-        text = ""
-        audio = ""
-        tool_calls = OrderedDict()
+        text_parts: list[str] = []
+        audio_parts: list[str] = []
+        tool_calls: dict[str, dict] = {}
         usage = None
         async with response as stream:
             async for event in stream:
-                et = getattr(event, "type", None)
-                if et == "response.error":
-                    logger.error("Responses stream error: %s",
-                                 getattr(event, "error", None))
-                    continue
-
-                if et == "response.output_text.delta":
-                    text += event.delta
-                    # Accumulate only — do NOT yield per-delta.  Emitting a
-                    # ChatResponse(TextBlock) on every delta causes the ReAct
-                    # agent to treat the first partial chunk as a completed
-                    # turn and return before the full response arrives.
+                # The SDK events are typed, so the required fields are read
+                # directly, and only the optional ones with defaults
+                et = event.type
+                if et not in _RESPONSES_STREAM_EVENTS:
                     continue
 
-                if et == "response.output_audio.delta":
-                    audio += event.delta
-                    continue
-
-                if et == "response.output_item.added":
-                    item = getattr(event, "item", None)
-                    if getattr(item, "type", None) == "function_call":
-                        tool_calls[item.id] = {
-                            "type": "tool_use",
-                            "id": item.call_id,
-                            "name": item.name,
-                            "input": "",
-                        }
-                    continue
+                # The delta events come first as they're the most frequent
+                match et:
+                    case "response.output_text.delta":
+                        # Accumulate only — do NOT yield per-delta. Emitting
+                        # a ChatResponse(TextBlock) on every delta causes the
+                        # ReAct agent to treat the first partial chunk as a
+                        # completed turn and return before the full response
+                        # arrives.
+                        text_parts.append(event.delta)
+
+                    case "response.function_call_arguments.delta":
+                        tc = tool_calls.get(event.item_id)
+                        if tc:
+                            tc["arg_parts"].append(event.delta)
+
+                    case "response.output_audio.delta":
+                        audio_parts.append(event.delta)
+
+                    case "response.output_item.added":
+                        item = event.item
+                        if item.type == "function_call":
+                            tool_calls[item.id] = {
+                                "type": "tool_use",
+                                "id": item.call_id,
+                                "name": item.name,
+                                "arg_parts": [],
+                                "input": None,
+                            }
+
+                    case "response.function_call_arguments.done":
+                        # Arguments are complete — update the stored input to
+                        # the final parsed form. The tool call is emitted
+                        # once in the consolidated response.completed block
+                        # below (not here) to avoid the ReAct agent seeing
+                        # duplicate ToolUseBlocks.
+                        tc = tool_calls.get(event.item_id)
+                        if tc:
+                            tc["input"] = _json_loads_with_repair(
+                                "".join(tc["arg_parts"]) or "{}",
+                            )
+
+                    case "response.error":
+                        logger.error(
+                            "Responses stream error: %s",
+                            getattr(event, "error", None),
+                        )
 
-                if et == "response.function_call_arguments.delta":
-                    tc = tool_calls.get(event.item_id)
-                    if tc:
-                        tc["input"] += event.delta
-                    continue
+                    case "response.completed":
+                        resp = event.response
+                        if getattr(resp, "usage", None):
+                            u = resp.usage
+                            input_tokens = (
+                                getattr(u, "input_text_tokens", None)
+                                or getattr(u, "prompt_tokens", None)
+                                or 0
+                            )
+                            output_tokens = (
+                                getattr(u, "output_text_tokens", None)
+                                or getattr(u, "completion_tokens", None)
+                                or 0
+                            )
+                            usage = ChatUsage(
+                                input_tokens=input_tokens,
+                                output_tokens=output_tokens,
+                                time=time.monotonic() - start_time,
+                            )
+                        # Emit a final consolidated response so the agent can
+                        # finalize its state with accurate usage info.
+                        contents: list[Any] = []
+                        audio = "".join(audio_parts)
+                        text = "".join(text_parts)
+                        if audio:
+                            contents.append(
+                                AudioBlock(
+                                    type="audio",
+                                    source=Base64Source(
+                                        data=audio,
+                                        media_type="audio/wav",
+                                        type="base64",
+                                    ),
+                                ),
+                            )
+                        if text:
+                            contents.append(TextBlock(type="text", text=text))
+                        for tc in tool_calls.values():
+                            contents.append(
+                                ToolUseBlock(
+                                    type="tool_use",
+                                    id=tc["id"],
+                                    name=tc["name"],
+                                    input=(
+                                        tc["input"]
+                                        if tc["input"] is not None
+                                        else _json_loads_with_repair(
+                                            "".join(tc["arg_parts"]) or "{}",
+                                        )
+                                    ),
+                                ),
+                            )
+                        if contents:
+                            yield ChatResponse(content=contents, usage=usage)
 
-                if et == "response.function_call_arguments.done":
-                    # Arguments are complete — update the stored input to the
-                    # final parsed form. The tool call is emitted once in the
-                    # consolidated response.completed block below (not here) to
-                    # avoid the ReAct agent seeing duplicate ToolUseBlocks.
-                    tc = tool_calls.get(event.item_id)
-                    if tc:
-                        tc["input"] = _json_loads_with_repair(
-                            tc["input"] or "{}")
-                    continue
+    def _parse_openai_responses_response(
+        self,
+        start_time: float,
+        response: Any,
+    ) -> ChatResponse:
+        """Parse non-streaming Responses API output into ChatResponse."""
+        contents: list[Any] = []
+        usage = None
+        output = getattr(response, "output", None)
+        if output:
+            for item in output:
+                match item.type:
+                    case "output_text":
+                        contents.append(TextBlock(type="text", text=item.text))
 
-                if et == "response.completed":
-                    resp = getattr(event, "response", None)
-                    if resp and getattr(resp, "usage", None):
-                        u = resp.usage
-                        input_tokens = (
-                            getattr(u, "input_text_tokens", None)
-                            or getattr(u, "prompt_tokens", None)
-                            or 0
-                        )
-                        output_tokens = (
-                            getattr(u, "output_text_tokens", None)
-                            or getattr(u, "completion_tokens", None)
-                            or 0
-                        )
-                        usage = ChatUsage(
-                            input_tokens=input_tokens,
-                            output_tokens=output_tokens,
-                            time=(datetime.now() -
-                                  start_datetime).total_seconds(),
-                        )
-                    # Emit a final consolidated response so the agent can
-                    # finalize its state with accurate usage info.
-                    contents: list[Any] = []
-                    if audio:
+                    case "output_audio":
                         contents.append(
                             AudioBlock(
                                 type="audio",
                                 source=Base64Source(
-                                    data=audio,
+                                    data=item.audio.get("data", ""),
                                     media_type="audio/wav",
                                     type="base64",
                                 ),
                             ),
                         )
-                    if text:
-                        contents.append(TextBlock(type="text", text=text))
-                    for tc in tool_calls.values():
+
+                    case "function_call":
+                        # The arguments parsed by the SDK, e.g. from
+                        # `responses.parse`, are used directly, and the raw
+                        # arguments are only repaired without them
+                        parsed_arguments = getattr(
+                            item,
+                            "parsed_arguments",
+                            None,
+                        )
                         contents.append(
                             ToolUseBlock(
                                 type="tool_use",
-                                id=tc["id"],
-                                name=tc["name"],
-                                input=(
-                                    tc["input"]
-                                    if isinstance(tc["input"], dict)
-                                    else _json_loads_with_repair(tc["input"] or "{}")
+                                id=item.call_id,
+                                name=item.name,
+                                input=parsed_arguments
+                                if parsed_arguments is not None
+                                else _json_loads_with_repair(
+                                    item.arguments or "{}",
                                 ),
                             ),
                         )
-                    if contents:
-                        yield ChatResponse(content=contents, usage=usage)
-
-    def _parse_openai_responses_response(
-        self,
-        start_datetime: datetime,
-        response: Any,
-    ) -> ChatResponse:
-        """Parse non-streaming Responses API output into ChatResponse."""
-        contents: list[Any] = []
-        usage = None
-        output = getattr(response, "output", None)
-        if output:
-            for item in output:
-                if item.type == "output_text":
-                    contents.append(TextBlock(type="text", text=item.text))
-                if item.type == "output_audio":
-                    contents.append(
-                        AudioBlock(
-                            type="audio",
-                            source=Base64Source(
-                                data=item.audio.get("data", ""),
-                                media_type="audio/wav",
-                                type="base64",
-                            ),
-                        ),
-                    )
-                # if item.type == "output_tool_calls":
-                #     for tc in item.tool_calls:
-                #         fn = tc.get("function", {})
-                #         args = fn.get("arguments", {})
-                #         contents.append(
-                #             ToolUseBlock(
-                #                 type="tool_use",
-                #                 id=tc.get("id"),
-                #                 name=fn.get("name"),
-                #                 input=args if isinstance(args, dict)
-                #                 else _json_loads_with_repair(args),
-                #             ),
-                #         )
-                if item.type == "function_call":
-                    contents.append(
-                        ToolUseBlock(
-                            type="tool_use",
-                            id=item.call_id,
-                            name=item.name,
-                            input=item.parsed_arguments
-                            if hasattr(item, "parsed_arguments")
-                            else _json_loads_with_repair(item.arguments or "{}"),
-                        )
-                    )
 
         if getattr(response, "usage", None):
             u = response.usage
@@ -1037,6 +1625,6 @@ class OpenAIChatModel(ChatModelBase):
             usage = ChatUsage(
                 input_tokens=input_tokens,
                 output_tokens=output_tokens,
-                time=(datetime.now() - start_datetime).total_seconds(),
+                time=time.monotonic() - start_time,
             )
         return ChatResponse(content=contents, usage=usage)
@@ -65,3 +65,4 @@ class TrinityChatModel(OpenAIChatModel):
             ] = enable_thinking
         # change the client instance to the provided one
         self.client = openai_async_client
+        self._has_responses_api = hasattr(openai_async_client, "responses")
@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 """The Voice chat room"""
 import asyncio
-from asyncio import Queue
+from asyncio import Queue, QueueFull
 
+from .._logging import logger
 from ..agent import RealtimeAgent
 from ..realtime import ClientEvents, ServerEvents
 
@@ -12,18 +13,32 @@ class ChatRoom:
     agents, and handle the messages from the frontend.
     """
 
-    def __init__(self, agents: list[RealtimeAgent]) -> None:
+    def __init__(
+        self,
+        agents: list[RealtimeAgent],
+        max_queue_size: int = 1024,
+    ) -> None:
         """Initialize the ChatRoom class.
 
         Args:
             agents (`list[RealtimeAgent]`):
                 The list of agents participating in the chat room.
+            max_queue_size (`int`, defaults to `1024`):
+                The maximum number of events waiting to be forwarded. When
+                the queue is full, the agents and the frontend wait until
+                the forwarding loop catches up, instead of the pending events
+                (e.g. audio deltas) piling up in memory. Unbounded if set to
+                0.
         """
         self.agents = agents
 
         # The queue used to gather messages from all agents and push them to
         # the frontend.
-        self._queue = Queue()
+        self._queue = Queue(maxsize=max_queue_size)
+
+        # The agents to broadcast the events of each agent to, i.e. all the
+        # other agents, which is built once the chat room starts
+        self._peers: dict[str, list[RealtimeAgent]] = {}
 
         self._task = None
 
@@ -39,6 +54,11 @@ class ChatRoom:
         for agent in self.agents:
             await agent.start(self._queue)
 
+        self._peers = {
+            agent.id: [_ for _ in self.agents if _.id != agent.id]
+            for agent in self.agents
+        }
+
         # Start the forwarding loop.
         self._task = asyncio.create_task(self._forward_loop(outgoing_queue))
 
@@ -59,22 +79,46 @@ class ChatRoom:
             # to avoid echoing client messages back
             if isinstance(event, ClientEvents.EventBase):
                 # Push the message to the frontend queue.
-                for agent in self.agents:
-                    await agent.handle_input(event)
+                await self._broadcast(event, self.agents)
 
             elif isinstance(event, ServerEvents.EventBase):
-                # Broadcast the message to all agents except the sender.
-                # Use create_task instead of gather to avoid blocking
-
                 # Forward the agent/server events to the frontend
                 await outgoing_queue.put(event)
 
-                # Broadcast to other agents
+                # Broadcast the message to all agents except the sender.
                 sender_id = getattr(event, "agent_id", None)
                 if sender_id:
-                    for agent in self.agents:
-                        if agent.id != sender_id:
-                            await agent.handle_input(event)
+                    await self._broadcast(
+                        event,
+                        self._peers.get(sender_id, self.agents),
+                    )
+
+    @staticmethod
+    async def _broadcast(
+        event: ClientEvents.EventBase | ServerEvents.EventBase,
+        agents: list[RealtimeAgent],
+    ) -> None:
+        """Deliver the event to the given agents concurrently, so that a
+        slow agent doesn't delay the others. A failed delivery is logged
+        instead of stopping the forwarding loop.
+
+        Args:
+            event (`ClientEvents.EventBase | ServerEvents.EventBase`):
+                The event to deliver.
+            agents (`list[RealtimeAgent]`):
+                The agents to deliver the event to.
+        """
+        results = await asyncio.gather(
+            *(agent.handle_input(event) for agent in agents),
+            return_exceptions=True,
+        )
+        for agent, result in zip(agents, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    "Failed to deliver the event to agent '%s': %s",
+                    agent.name,
+                    result,
+                )
 
     async def stop(self) -> None:
         """Close connections for all agents in the chat room."""
@@ -94,4 +138,12 @@ class ChatRoom:
             event (`ClientEvents.EventBase`):
                 The event from the frontend.
         """
-        await self._queue.put(event)
+        try:
+            self._queue.put_nowait(event)
+        except QueueFull:
+            logger.warning(
+                "The chat room queue is full with %d events. Waiting for "
+                "them to be forwarded before handling the new input.",
+                self._queue.maxsize,
+            )
+            await self._queue.put(event)
@@ -1,11 +1,12 @@
 # -*- coding: utf-8 -*-
 """The PowerPoint reader to read and chunk PowerPoint presentations."""
+import asyncio
 import base64
 import hashlib
 from typing import Any, Literal
 
 from ._reader_base import ReaderBase
-from ._text_reader import TextReader
+from ._text_reader import TextReader, _download_nltk_resources
 from ._utils import (
     _get_media_type_from_data,
     _table_to_json,
@@ -15,6 +16,36 @@ from .._document import Document, DocMetadata
 from ...message import ImageBlock, Base64Source, TextBlock
 from ..._logging import logger
 
+_PICTURE_SHAPE_TYPE = 13
+"""The value of `MSO_SHAPE_TYPE.PICTURE` in python-pptx, whose shape types
+are int enums. The value is used directly so that the enum isn't imported
+for every shape, while importing python-pptx at the module level would slow
+down importing the RAG module."""
+
+_SNIFFED_MEDIA_TYPES = frozenset(
+    ["image/jpeg", "image/png", "image/gif", "image/bmp", "image/webp"],
+)
+"""The media types that can be determined from the image data. Images of
+other types, e.g. EMF, are still sniffed from the data as before."""
+
+
+def _normalize_line_breaks(text: str) -> str:
+    """Replace the line breaks in the text with `\n` to preserve structure.
+
+    Args:
+        text (`str`):
+            The text to normalize.
+
+    Returns:
+        `str`:
+            The text with `\r\n` and `\r` replaced by `\n`.
+    """
+    # Most cells have no carriage return, so they're checked with one scan
+    # before replacing
+    if "\r" in text:
+        return text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
 
 def _extract_table_data(table: Any) -> list[list[str]]:
     """Extract table data from a PowerPoint table.
@@ -28,25 +59,27 @@ def _extract_table_data(table: Any) -> list[list[str]]:
             Table data represented as a 2D list, where each inner list
             represents a row, and each string in the row represents a cell.
     """
-    table_data = []
-    for row in table.rows:
-        row_data = []
-        for cell in row.cells:
-            # Extract text from cell, preserving line breaks within cells
-            cell_text = cell.text.strip()
-            # Replace line breaks with \n to preserve structure
-            cell_text = cell_text.replace("\r\n", "\n").replace("\r", "\n")
-            row_data.append(cell_text)
-        table_data.append(row_data)
-    return table_data
-
-
-def _extract_images_from_shape(shape: Any) -> list[ImageBlock]:
+    # Extract text from cells, preserving line breaks within cells
+    return [
+        [_normalize_line_breaks(cell.text.strip()) for cell in row.cells]
+        for row in table.rows
+    ]
+
+
+def _extract_images_from_shape(
+    shape: Any,
+    image_cache: dict[bytes, tuple[str, str]] | None = None,
+) -> list[ImageBlock]:
     """Extract images from a shape (if it contains images).
 
     Args:
         shape (`Any`):
             The shape object from python-pptx.
+        image_cache (`dict[bytes, tuple[str, str]] | None`, optional):
+            The media types and base64 data of the images extracted so far,
+            keyed by the SHA-256 digests of the images. The same image (e.g.
+            a logo on every slide) is only encoded once and its base64 data
+            is shared, if given.
 
     Returns:
         `list[ImageBlock]`:
@@ -55,23 +88,31 @@ def _extract_images_from_shape(shape: Any) -> list[ImageBlock]:
     images = []
 
     # Check if shape is a picture
-    try:
-        from pptx.enum.shapes import MSO_SHAPE_TYPE
-
-        picture_type = MSO_SHAPE_TYPE.PICTURE
-    except ImportError:
-        picture_type = 13  # MSO_SHAPE_TYPE.PICTURE fallback
-
-    if shape.shape_type == picture_type:
+    if shape.shape_type == _PICTURE_SHAPE_TYPE:
         try:
             # Get image data
             image_data = shape.image.blob
 
-            # Determine media type
-            media_type = _get_media_type_from_data(image_data)
+            digest: bytes | None = None
+            cached = None
+            if image_cache is not None:
+                digest = hashlib.sha256(image_data).digest()
+                cached = image_cache.get(digest)
+
+            if cached is not None:
+                media_type, base64_data = cached
+            else:
+                # Use the media type recorded in the presentation, and only
+                # sniff the image data for the types it can't tell
+                media_type = shape.image.content_type
+                if media_type not in _SNIFFED_MEDIA_TYPES:
+                    media_type = _get_media_type_from_data(image_data)
+
+                # Convert to base64
+                base64_data = base64.b64encode(image_data).decode("utf-8")
 
-            # Convert to base64
-            base64_data = base64.b64encode(image_data).decode("utf-8")
+                if image_cache is not None and digest is not None:
+                    image_cache[digest] = (media_type, base64_data)
 
             images.append(
                 ImageBlock(
@@ -89,6 +130,25 @@ def _extract_images_from_shape(shape: Any) -> list[ImageBlock]:
     return images
 
 
+def _join_text_parts(
+    blocks: list[TextBlock | ImageBlock],
+    text_parts: list[str],
+) -> None:
+    """Join the texts merged into the last text block into its text, and
+    clear them for the next text block.
+
+    Args:
+        blocks (`list[TextBlock | ImageBlock]`):
+            The blocks, where the last one is the text block that the texts
+            are merged into.
+        text_parts (`list[str]`):
+            The texts of the last text block, starting with its own text.
+    """
+    if len(text_parts) > 1:
+        blocks[-1]["text"] = "\n".join(text_parts)
+    text_parts.clear()
+
+
 class PowerPointReader(ReaderBase):
     """The PowerPoint reader that supports reading text, image, and table
     content from PowerPoint presentations (.pptx files), and chunking the text
@@ -161,9 +221,27 @@ class PowerPointReader(ReaderBase):
         self.slide_prefix = slide_prefix
         self.slide_suffix = slide_suffix
 
+        # The slide prefix split around its `{index}` placeholders, so that
+        # the slide headers are built without parsing the template for every
+        # slide. Prefixes with other format fields are still formatted.
+        self._slide_prefix_parts = None
+        if slide_prefix is not None:
+            template = slide_prefix.replace("{index}", "")
+            if "{" not in template and "}" not in template:
+                self._slide_prefix_parts = slide_prefix.split("{index}")
+
         # Use TextReader to do the chunking
         self._text_reader = TextReader(self.chunk_size, self.split_by)
 
+        if self.split_by == "sentence":
+            # Prepare the nltk resources when creating the reader, rather
+            # than when the first text block is split during reading
+            try:
+                _download_nltk_resources()
+            except ImportError:
+                # The error is raised when the text is split by sentences
+                pass
+
     def _validate_init_params(self, chunk_size: int, split_by: str) -> None:
         """Validate initialization parameters.
 
@@ -242,8 +320,7 @@ class PowerPointReader(ReaderBase):
         """
         # Get all blocks from all slides in order
         all_blocks = []
-        for slide_idx, slide in enumerate(prs.slides):
-            slide_blocks = self._get_slide_blocks(slide, slide_idx)
+        for slide_blocks in await self._get_all_slide_blocks(prs):
             all_blocks.extend(slide_blocks)
 
         # Convert blocks to documents
@@ -269,17 +346,44 @@ class PowerPointReader(ReaderBase):
         """
         all_docs = []
 
-        for slide_idx, slide in enumerate(prs.slides):
-            slide_blocks = self._get_slide_blocks(slide, slide_idx)
+        for slide_blocks in await self._get_all_slide_blocks(prs):
             slide_docs = await self._blocks_to_documents(slide_blocks, doc_id)
             all_docs.extend(slide_docs)
 
         return all_docs
 
+    async def _get_all_slide_blocks(
+        self,
+        prs: Any,
+    ) -> list[list[TextBlock | ImageBlock]]:
+        """Extract the data blocks of all slides in a worker thread, since
+        parsing the shapes and encoding the images with python-pptx is
+        blocking and would stall the event loop for large presentations.
+
+        Args:
+            prs (`Any`):
+                The python-pptx Presentation object.
+
+        Returns:
+            `list[list[TextBlock | ImageBlock]]`:
+                The data blocks of each slide, in the order of the slides.
+        """
+
+        def _extract() -> list[list[TextBlock | ImageBlock]]:
+            # The images repeated across the slides are encoded only once
+            image_cache: dict[bytes, tuple[str, str]] = {}
+            return [
+                self._get_slide_blocks(slide, slide_idx, image_cache)
+                for slide_idx, slide in enumerate(prs.slides)
+            ]
+
+        return await asyncio.to_thread(_extract)
+
     def _get_slide_blocks(
         self,
         slide: Any,
         slide_idx: int,
+        image_cache: dict[bytes, tuple[str, str]] | None = None,
     ) -> list[TextBlock | ImageBlock]:
         """Extract all data blocks from a slide in order (text, table, image).
 
@@ -288,6 +392,8 @@ class PowerPointReader(ReaderBase):
                 The slide object from python-pptx.
             slide_idx (`int`):
                 The index of the slide.
+            image_cache (`dict[bytes, tuple[str, str]] | None`, optional):
+                The cache of the encoded images shared across the slides.
 
         Returns:
             `list[TextBlock | ImageBlock]`:
@@ -296,6 +402,11 @@ class PowerPointReader(ReaderBase):
         """
         blocks: list[TextBlock | ImageBlock] = []
         last_type = None
+        # The texts merged into the last text block, which are joined once
+        # the block is complete instead of growing the block text each time
+        text_parts: list[str] = []
+        # The index of the last text block, where the slide suffix goes
+        last_text_idx = -1
 
         # Generate slide header from prefix if provided
         slide_header = self._get_slide_header(slide_idx)
@@ -307,10 +418,17 @@ class PowerPointReader(ReaderBase):
                 blocks,
                 last_type,
                 slide_header,
+                text_parts,
+                image_cache,
             )
+            # Text and tables are merged into or added as the last block
+            if last_type in ("text", "table"):
+                last_text_idx = len(blocks) - 1
+
+        _join_text_parts(blocks, text_parts)
 
         # Add slide suffix to the last text block if provided
-        self._add_slide_suffix(blocks, slide_header)
+        self._add_slide_suffix(blocks, slide_header, last_text_idx)
 
         return blocks
 
@@ -325,6 +443,8 @@ class PowerPointReader(ReaderBase):
             `str`:
                 The slide header string, or empty string if no prefix.
         """
+        if self._slide_prefix_parts is not None:
+            return str(slide_idx + 1).join(self._slide_prefix_parts)
         if self.slide_prefix is not None:
             return self.slide_prefix.format(index=slide_idx + 1)
         return ""
@@ -336,6 +456,8 @@ class PowerPointReader(ReaderBase):
         blocks: list[TextBlock | ImageBlock],
         last_type: str | None,
         slide_header: str,
+        text_parts: list[str],
+        image_cache: dict[bytes, tuple[str, str]] | None = None,
     ) -> str | None:
         """Process a single shape and add its content to blocks.
 
@@ -350,6 +472,10 @@ class PowerPointReader(ReaderBase):
                 The type of the last block.
             slide_header (`str`):
                 The slide header to prepend if this is the first block.
+            text_parts (`list[str]`):
+                The texts merged into the last text block so far.
+            image_cache (`dict[bytes, tuple[str, str]] | None`, optional):
+                The cache of the encoded images shared across the slides.
 
         Returns:
             `str | None`:
@@ -358,12 +484,14 @@ class PowerPointReader(ReaderBase):
         shape_type, extracted_data = self._extract_shape_content(
             shape,
             slide_idx,
+            image_cache,
         )
 
         if not extracted_data:
             return last_type
 
         if shape_type == "image" and isinstance(extracted_data, list):
+            _join_text_parts(blocks, text_parts)
             blocks.extend(extracted_data)
             return "image"
 
@@ -373,6 +501,7 @@ class PowerPointReader(ReaderBase):
                 extracted_data,
                 last_type,
                 slide_header,
+                text_parts,
             )
 
         if shape_type == "text" and isinstance(extracted_data, str):
@@ -381,6 +510,7 @@ class PowerPointReader(ReaderBase):
                 extracted_data,
                 last_type,
                 slide_header,
+                text_parts,
             )
 
         return last_type
@@ -389,6 +519,7 @@ class PowerPointReader(ReaderBase):
         self,
         blocks: list[TextBlock | ImageBlock],
         slide_header: str,
+        last_text_idx: int,
     ) -> None:
         """Add slide suffix to the last text block if provided.
 
@@ -400,15 +531,17 @@ class PowerPointReader(ReaderBase):
                 The list of blocks to modify.
             slide_header (`str`):
                 The slide header to use if creating a new text block.
+            last_text_idx (`int`):
+                The index of the last text block in the blocks, or -1 if
+                there is no text block.
         """
         if self.slide_suffix is None or not blocks:
             return
 
-        # Find the last text block and append suffix
-        for i in range(len(blocks) - 1, -1, -1):
-            if blocks[i].get("type") == "text":
-                blocks[i]["text"] += "\n" + self.slide_suffix
-                return
+        # Append suffix to the last text block
+        if last_text_idx >= 0:
+            blocks[last_text_idx]["text"] += "\n" + self.slide_suffix
+            return
 
         # No text block found (slide contains only images),
         # create a new text block for the suffix
@@ -423,6 +556,7 @@ class PowerPointReader(ReaderBase):
         self,
         shape: Any,
         slide_idx: int,
+        image_cache: dict[bytes, tuple[str, str]] | None = None,
     ) -> tuple[str | None, list[ImageBlock] | str | None]:
         """Extract content from a shape (image, table, or text).
 
@@ -431,6 +565,8 @@ class PowerPointReader(ReaderBase):
                 The shape object from python-pptx.
             slide_idx (`int`):
                 The index of the slide (for error logging).
+            image_cache (`dict[bytes, tuple[str, str]] | None`, optional):
+                The cache of the encoded images shared across the slides.
 
         Returns:
             `tuple[str | None, list[ImageBlock] | str | None]`:
@@ -439,12 +575,13 @@ class PowerPointReader(ReaderBase):
         """
         # Check for images first
         if self.include_image:
-            shape_images = _extract_images_from_shape(shape)
+            shape_images = _extract_images_from_shape(shape, image_cache)
             if shape_images:
                 return ("image", shape_images)
 
-        # Check for tables
-        if hasattr(shape, "has_table") and shape.has_table:
+        # Check for tables. The `has_*` properties are evaluated on the XML,
+        # so they're read once by `getattr` instead of `hasattr` and access
+        if getattr(shape, "has_table", False):
             try:
                 table_data = _extract_table_data(shape.table)
                 if self.table_format == "markdown":
@@ -459,13 +596,17 @@ class PowerPointReader(ReaderBase):
                 return (None, None)
 
         # Extract text from text frames
-        if hasattr(shape, "has_text_frame") and shape.has_text_frame:
+        if getattr(shape, "has_text_frame", False):
             try:
                 text_frame = shape.text_frame
+                # The paragraph text is built from the XML on every access,
+                # so it's read once per paragraph
                 text_parts = [
-                    para.text.strip()
-                    for para in text_frame.paragraphs
-                    if para.text.strip()
+                    text
+                    for text in (
+                        para.text.strip() for para in text_frame.paragraphs
+                    )
+                    if text
                 ]
                 if text_parts:
                     return ("text", "\n".join(text_parts))
@@ -484,6 +625,7 @@ class PowerPointReader(ReaderBase):
         table_text: str,
         last_type: str | None,
         slide_header: str,
+        text_parts: list[str],
     ) -> str:
         """Add a table block to the blocks list.
 
@@ -496,6 +638,8 @@ class PowerPointReader(ReaderBase):
                 The type of the last block.
             slide_header (`str`):
                 The slide header to prepend if this is the first block.
+            text_parts (`list[str]`):
+                The texts merged into the last text block so far.
 
         Returns:
             `str`:
@@ -508,16 +652,18 @@ class PowerPointReader(ReaderBase):
         )
 
         if should_merge:
-            blocks[-1]["text"] += "\n" + table_text
+            text_parts.append(table_text)
         else:
             if last_type is None and slide_header:
                 table_text = slide_header + "\n" + table_text
+            _join_text_parts(blocks, text_parts)
             blocks.append(
                 TextBlock(
                     type="text",
                     text=table_text,
                 ),
             )
+            text_parts.append(table_text)
 
         return "table"
 
@@ -527,6 +673,7 @@ class PowerPointReader(ReaderBase):
         text: str,
         last_type: str | None,
         slide_header: str,
+        text_parts: list[str],
     ) -> str:
         """Add a text block to the blocks list.
 
@@ -539,6 +686,8 @@ class PowerPointReader(ReaderBase):
                 The type of the last block.
             slide_header (`str`):
                 The slide header to prepend if this is the first block.
+            text_parts (`list[str]`):
+                The texts merged into the last text block so far.
 
         Returns:
             `str`:
@@ -550,16 +699,18 @@ class PowerPointReader(ReaderBase):
         ) and blocks
 
         if should_merge:
-            blocks[-1]["text"] += "\n" + text
+            text_parts.append(text)
         else:
             if last_type is None and slide_header:
                 text = slide_header + "\n" + text
+            _join_text_parts(blocks, text_parts)
             blocks.append(
                 TextBlock(
                     type="text",
                     text=text,
                 ),
             )
+            text_parts.append(text)
 
         return "text"
 
@@ -582,10 +733,21 @@ class PowerPointReader(ReaderBase):
         """
         documents = []
 
+        # Process text blocks through TextReader for chunking, all at once
+        # and in the order of the blocks
+        text_docs = iter(
+            await asyncio.gather(
+                *[
+                    self._text_reader(block["text"])
+                    for block in blocks
+                    if block["type"] == "text"
+                ],
+            ),
+        )
+
         for block in blocks:
             if block["type"] == "text":
-                # Process text blocks through TextReader for chunking
-                for _ in await self._text_reader(block["text"]):
+                for _ in next(text_docs):
                     documents.append(
                         Document(
                             metadata=DocMetadata(
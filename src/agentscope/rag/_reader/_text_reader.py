@@ -9,6 +9,32 @@ from .._document import DocMetadata
 from ..._logging import logger
 from ...message import TextBlock
 
+_NLTK_RESOURCES = ("punkt", "punkt_tab")
+"""The nltk resources required to split the text by sentences."""
+
+_downloaded_nltk_resources: set[str] = set()
+"""The nltk resources that are already downloaded in this process, which
+are not checked again since checking them verifies the local files."""
+
+
+def _download_nltk_resources() -> None:
+    """Download the nltk resources required to split the text by sentences.
+    The readers call the text reader once per text block, so the resources
+    are only checked and downloaded once per process.
+
+    Raises:
+        `ImportError`:
+            If nltk is not installed.
+    """
+    import nltk
+
+    for resource in _NLTK_RESOURCES:
+        if resource not in _downloaded_nltk_resources and nltk.download(
+            resource,
+            quiet=True,
+        ):
+            _downloaded_nltk_resources.add(resource)
+
 
 class TextReader(ReaderBase):
     """The text reader that splits text into chunks by a fixed chunk size
@@ -82,8 +108,7 @@ class TextReader(ReaderBase):
             try:
                 import nltk
 
-                nltk.download("punkt", quiet=True)
-                nltk.download("punkt_tab", quiet=True)
+                _download_nltk_resources()
             except ImportError as e:
                 raise ImportError(
                     "nltk is not installed. Please install it with "
@@ -2,6 +2,11 @@
 """Utility functions for RAG readers."""
 import json
 
+_TABLE_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+"""The encoder to dump tables into JSON strings, which is created once since
+`json.dumps` creates a new encoder in every call with non-default
+arguments."""
+
 
 def _get_media_type_from_data(data: bytes) -> str:
     """Determine media type from image data.
@@ -14,22 +19,25 @@ def _get_media_type_from_data(data: bytes) -> str:
         `str`:
             The MIME type of the image (e.g., "image/png", "image/jpeg").
     """
-    # Image signature mapping
-    signatures = {
-        b"\x89PNG\r\n\x1a\n": "image/png",
-        b"\xff\xd8": "image/jpeg",
-        b"GIF87a": "image/gif",
-        b"GIF89a": "image/gif",
-        b"BM": "image/bmp",
-    }
-
-    # Check signatures
-    for signature, media_type in signatures.items():
-        if data.startswith(signature):
-            return media_type
+    # The signatures are checked on the leading bytes, which are copied once
+    # and then compared, with the most common formats in presentations and
+    # spreadsheets first
+    head = bytes(data[:12])
+
+    if head[:2] == b"\xff\xd8":
+        return "image/jpeg"
+
+    if head[:8] == b"\x89PNG\r\n\x1a\n":
+        return "image/png"
+
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        return "image/gif"
+
+    if head[:2] == b"BM":
+        return "image/bmp"
 
     # Check WebP (RIFF at start + WEBP at offset 8)
-    if len(data) > 12 and data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+    if len(data) > 12 and head[:4] == b"RIFF" and head[8:12] == b"WEBP":
         return "image/webp"
 
     # Default to JPEG
@@ -48,7 +56,7 @@ def _table_to_json(table_data: list[list[str]]) -> str:
             A JSON string representing the table as a 2D array,
             prefixed with a system-info tag.
     """
-    json_str = json.dumps(table_data, ensure_ascii=False)
+    json_str = _TABLE_JSON_ENCODER.encode(table_data)
     return (
         "<system-info>A table loaded as a JSON array:</system-info>\n"
         + json_str
@@ -73,22 +81,21 @@ def _table_to_markdown(table_data: list[list[str]]) -> str:
     if num_cols == 0:
         return ""
 
-    md_table = ""
-
-    # Header row
-    header_row = "| " + " | ".join(table_data[0]) + " |\n"
-    md_table += header_row
-
-    # Separator row
-    separator_row = "| " + " | ".join(["---"] * num_cols) + " |\n"
-    md_table += separator_row
+    # The rows are collected and joined once, instead of growing the table
+    # string row by row
+    rows = [
+        # Header row
+        "| " + " | ".join(table_data[0]) + " |",
+        # Separator row
+        "| " + " | ".join(["---"] * num_cols) + " |",
+    ]
 
     # Data rows
     for row in table_data[1:]:
-        # Ensure row has same number of columns as header
-        while len(row) < num_cols:
-            row.append("")
-        data_row = "| " + " | ".join(row[:num_cols]) + " |\n"
-        md_table += data_row
+        # Ensure row has same number of columns as header, without
+        # modifying the given row
+        padding = num_cols - len(row)
+        cells = row + [""] * padding if padding > 0 else row[:num_cols]
+        rows.append("| " + " | ".join(cells) + " |")
 
-    return md_table
+    return "\n".join(rows) + "\n"
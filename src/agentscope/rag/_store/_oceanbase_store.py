@@ -34,6 +34,11 @@ _SCORE_CONVERTERS: dict[str, Callable[[float], float]] = {
     "COSINE": lambda d: 1.0 - d,  # COSINE converts distance to similarity
 }
 
+# The encoder of the unique strings that the primary keys are mapped from,
+# created once since `json.dumps` creates a new encoder in every call with
+# non-default arguments
+_UNIQUE_STRING_ENCODER = json.JSONEncoder(ensure_ascii=True, sort_keys=True)
+
 
 class OceanBaseStore(VDBStoreBase):
     """The OceanBase vector store implementation, supporting OceanBase and
@@ -62,6 +67,8 @@ class OceanBaseStore(VDBStoreBase):
         distance: Literal["COSINE", "L2", "IP"] = "COSINE",
         client_kwargs: dict[str, Any] | None = None,
         collection_kwargs: dict[str, Any] | None = None,
+        batch_size: int = 1000,
+        max_concurrency: int = 4,
     ) -> None:
         """Initialize the OceanBase vector store.
 
@@ -86,7 +93,24 @@ class OceanBaseStore(VDBStoreBase):
                 Explicit connection arguments override matching keys here.
             collection_kwargs (`dict[str, Any] | None`, optional):
                 Keyword arguments passed to `create_collection`.
+            batch_size (`int`, defaults to `1000`):
+                The maximum number of documents inserted in one `insert`
+                call when adding documents.
+            max_concurrency (`int`, defaults to `4`):
+                The maximum number of batches inserted at the same time when
+                adding documents.
         """
+        if batch_size <= 0:
+            raise ValueError(
+                f"The batch_size must be positive, got {batch_size}",
+            )
+
+        if max_concurrency <= 0:
+            raise ValueError(
+                "The max_concurrency must be positive, got "
+                f"{max_concurrency}",
+            )
+
         try:
             import pyobvector
         except ImportError as e:
@@ -110,6 +134,8 @@ class OceanBaseStore(VDBStoreBase):
         self.dimensions = dimensions
         self.distance = distance
         self.collection_kwargs = collection_kwargs or {}
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
         self._collection_ready = False
 
     def _get_metric_type(self) -> str:
@@ -256,42 +282,78 @@ class OceanBaseStore(VDBStoreBase):
                 "Document embedding is required for OceanBaseStore.add.",
             )
 
+        metadata = doc.metadata
+
         # Create unique ID from document metadata
-        unique_string = json.dumps(
+        unique_string = _UNIQUE_STRING_ENCODER.encode(
             {
-                "doc_id": doc.metadata.doc_id,
-                "chunk_id": doc.metadata.chunk_id,
-                "content": doc.metadata.content,
+                "doc_id": metadata.doc_id,
+                "chunk_id": metadata.chunk_id,
+                "content": metadata.content,
             },
-            ensure_ascii=True,
-            sort_keys=True,
         )
 
         return {
             self.PRIMARY_FIELD: _map_text_to_uuid(unique_string),
             self.VECTOR_FIELD: doc.embedding,
-            self.DOC_ID_FIELD: doc.metadata.doc_id,
-            self.CHUNK_ID_FIELD: doc.metadata.chunk_id,
-            self.TOTAL_CHUNKS_FIELD: doc.metadata.total_chunks,
-            self.CONTENT_FIELD: doc.metadata.content,
+            self.DOC_ID_FIELD: metadata.doc_id,
+            self.CHUNK_ID_FIELD: metadata.chunk_id,
+            self.TOTAL_CHUNKS_FIELD: metadata.total_chunks,
+            self.CONTENT_FIELD: metadata.content,
         }
 
+    def _insert_documents(
+        self,
+        documents: list[Document],
+        **kwargs: Any,
+    ) -> None:
+        """Convert a batch of documents and insert them into the collection.
+
+        Args:
+            documents (`list[Document]`):
+                The batch of documents to insert.
+        """
+        self._client.insert(
+            collection_name=self.collection_name,
+            data=[self._document_to_dict(doc) for doc in documents],
+            **kwargs,
+        )
+
     async def add(self, documents: list[Document], **kwargs: Any) -> None:
         """Add embeddings to the OceanBase vector store.
 
+        .. note:: The documents are converted and inserted in batches of
+         `batch_size` in worker threads, with at most `max_concurrency`
+         batches inserted at the same time. If a batch fails, the other
+         batches may have been inserted already.
+
         Args:
             documents (`list[Document]`):
                 A list of embedding records to be recorded in the store.
         """
         await self._validate_collection()
 
-        data = [self._document_to_dict(doc) for doc in documents]
+        # Check the embeddings before any batch is inserted
+        if any(doc.embedding is None for doc in documents):
+            raise ValueError(
+                "Document embedding is required for OceanBaseStore.add.",
+            )
 
-        await asyncio.to_thread(
-            self._client.insert,
-            collection_name=self.collection_name,
-            data=data,
-            **kwargs,
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _insert_batch(batch: list[Document]) -> None:
+            async with semaphore:
+                await asyncio.to_thread(
+                    self._insert_documents,
+                    batch,
+                    **kwargs,
+                )
+
+        await asyncio.gather(
+            *[
+                _insert_batch(documents[i : i + self.batch_size])
+                for i in range(0, len(documents), self.batch_size)
+            ],
         )
 
     @staticmethod
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 """Unit tests for DashScope API model class."""
+import copy
 from typing import Any, AsyncGenerator
 from unittest.async_case import IsolatedAsyncioTestCase
 from unittest.mock import Mock, patch
@@ -340,6 +341,42 @@ class TestDashScopeChatModel(IsolatedAsyncioTestCase):
             ]
             self.assertEqual(final_response.content, expected_content)
 
+    async def test_streaming_response_coalescing(self) -> None:
+        """Test that streaming chunks are coalesced within the window."""
+        model = DashScopeChatModel(
+            model_name="qwen-turbo",
+            api_key="test_key",
+            stream=True,
+            stream_coalesce_ms=60_000,
+        )
+        messages = [{"role": "user", "content": "Hello"}]
+
+        chunks = [
+            self._create_mock_chunk(content="Hello"),
+            self._create_mock_chunk(content=" there"),
+            self._create_mock_chunk(content="!"),
+        ]
+
+        with patch(
+            "dashscope.aigc.generation.AioGeneration.call",
+        ) as mock_call:
+            mock_call.return_value = self._create_async_generator(chunks)
+            result = await model(messages)
+
+            responses = [response async for response in result]
+
+        # The first chunk is yielded immediately, and the remaining ones
+        # are flushed together at the end of the stream
+        self.assertEqual(len(responses), 2)
+        self.assertEqual(
+            responses[0].content,
+            [TextBlock(type="text", text="Hello")],
+        )
+        self.assertEqual(
+            responses[-1].content,
+            [TextBlock(type="text", text="Hello there!")],
+        )
+
     def test_tools_schema_validation_through_api(self) -> None:
         """Test tools schema validation through API call."""
         model = DashScopeChatModel(
@@ -401,6 +438,43 @@ class TestDashScopeChatModel(IsolatedAsyncioTestCase):
             with self.assertRaises(RuntimeError):
                 await model(messages)
 
+    async def test_call_with_response_cache(self) -> None:
+        """Test that deterministic non-streaming responses are cached."""
+        model = DashScopeChatModel(
+            model_name="qwen-turbo",
+            api_key="test_key",
+            stream=False,
+            generate_kwargs={"temperature": 0},
+            response_cache_size=2,
+        )
+        messages = [{"role": "user", "content": "Hello"}]
+
+        mock_response = self._create_mock_response("Hi!")
+        with patch(
+            "dashscope.aigc.generation.AioGeneration.call",
+        ) as mock_call:
+            mock_call.return_value = mock_response
+            first = await model(messages)
+            first_content = copy.deepcopy(first.content)
+            # Modifying the returned response doesn't affect the cache
+            first.content.append(TextBlock(type="text", text="INJECTED"))
+            second = await model(messages)
+            self.assertEqual(mock_call.call_count, 1)
+            self.assertEqual(second.content, first_content)
+            self.assertIsNot(first.content, second.content)
+
+            # The cached response consumes no tokens
+            self.assertEqual(first.usage.input_tokens, 10)
+            self.assertEqual(second.usage.input_tokens, 0)
+            self.assertEqual(second.usage.output_tokens, 0)
+            self.assertIsNot(first.usage, second.usage)
+
+            # A different request or a non-zero temperature misses the cache
+            await model([{"role": "user", "content": "Bye"}])
+            await model(messages, temperature=0.7)
+            await model(messages, temperature=0.7)
+            self.assertEqual(mock_call.call_count, 4)
+
     # Auxiliary methods
     def _create_mock_response(self, content: str) -> Mock:
         """Create a standard mock response."""
@@ -1,11 +1,17 @@
 # -*- coding: utf-8 -*-
 """Unit tests for OpenAI API model class."""
+import asyncio
+import time
 from typing import AsyncGenerator, Any
 from unittest.async_case import IsolatedAsyncioTestCase
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import Mock, MagicMock, patch, AsyncMock
 from pydantic import BaseModel
 
 from agentscope.model import OpenAIChatModel, ChatResponse
+from agentscope.model._openai_model import (
+    _build_responses_input,
+    _format_audio_data_for_qwen_omni,
+)
 from agentscope.message import TextBlock, ToolUseBlock, ThinkingBlock
 
 
@@ -56,6 +62,107 @@ class TestOpenAIChatModel(IsolatedAsyncioTestCase):
                 timeout=30,
             )
 
+    def test_init_with_max_connections(self) -> None:
+        """Test that a tuned HTTP client is created for max_connections."""
+        with patch("openai.AsyncClient") as mock_client:
+            OpenAIChatModel(
+                model_name="gpt-4",
+                api_key="test_key",
+                max_connections=50,
+            )
+            http_client = mock_client.call_args[1]["http_client"]
+            # pylint: disable=protected-access
+            pool = http_client._transport._pool
+            self.assertEqual(pool._max_connections, 50)
+            self.assertEqual(pool._max_keepalive_connections, 5)
+
+    def test_init_with_aiohttp_transport(self) -> None:
+        """Test that the aiohttp-based HTTP client is used on request."""
+        with patch("openai.AsyncClient") as mock_client, patch(
+            "openai.DefaultAioHttpClient",
+        ) as mock_http_client, patch.dict(
+            "sys.modules",
+            {"httpx_aiohttp": MagicMock()},
+        ):
+            OpenAIChatModel(
+                model_name="gpt-4",
+                api_key="test_key",
+                use_aiohttp_transport=True,
+            )
+            mock_http_client.assert_called_once_with()
+            self.assertIs(
+                mock_client.call_args[1]["http_client"],
+                mock_http_client.return_value,
+            )
+
+        with self.assertRaises(ValueError):
+            OpenAIChatModel(
+                model_name="gpt-4",
+                api_key="test_key",
+                http2=True,
+                use_aiohttp_transport=True,
+            )
+
+    def test_format_audio_data_for_qwen_omni(self) -> None:
+        """Test that only the raw base64 audio data is prefixed."""
+        messages = [
+            {"role": "system", "content": "You're a helpful assistant."},
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": "Listen"},
+                    {"type": "input_audio", "input_audio": {"data": "AAAA"}},
+                    {
+                        "type": "input_audio",
+                        "input_audio": {"data": "https://example.com/a.wav"},
+                    },
+                    {
+                        "type": "input_audio",
+                        "input_audio": {"data": "data:;base64,BBBB"},
+                    },
+                ],
+            },
+        ]
+        _format_audio_data_for_qwen_omni(messages)
+        self.assertListEqual(
+            [_["input_audio"]["data"] for _ in messages[1]["content"][1:]],
+            [
+                "data:;base64,AAAA",
+                "https://example.com/a.wav",
+                "data:;base64,BBBB",
+            ],
+        )
+
+    def test_build_responses_input(self) -> None:
+        """Test that the messages are converted into the Responses API
+        format, and the ones already in that format are passed through."""
+        converted = {
+            "role": "assistant",
+            "content": [{"type": "output_text", "text": "Hi"}],
+        }
+        messages = [
+            {"role": "USER", "content": [{"type": "text", "text": "Hello"}]},
+            converted,
+            {"role": "tool", "content": None},
+        ]
+        responses_input = _build_responses_input(messages)
+
+        self.assertIs(responses_input[1], converted)
+        self.assertListEqual(
+            responses_input,
+            [
+                {
+                    "role": "user",
+                    "content": [{"type": "input_text", "text": "Hello"}],
+                },
+                converted,
+                {
+                    "role": "assistant",
+                    "content": [{"type": "output_text", "text": ""}],
+                },
+            ],
+        )
+
     async def test_call_with_regular_model(self) -> None:
         """Test calling a regular model."""
         with patch("openai.AsyncClient") as mock_client_class:
@@ -360,7 +467,182 @@ class TestOpenAIChatModel(IsolatedAsyncioTestCase):
             expected_content = [TextBlock(type="text", text="Hello there!")]
             self.assertEqual(final_response.content, expected_content)
 
-    def _create_stream_mock(self, chunks_data: list) -> Any:
+    async def test_call_with_multiple_choices(self) -> None:
+        """Test that multiple choices are returned as a list with n > 1."""
+        with patch("openai.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            model = OpenAIChatModel(
+                model_name="gpt-4",
+                api_key="test_key",
+                stream=False,
+            )
+            model.client = mock_client
+
+            mock_response = self._create_mock_response("First")
+            second_choice = self._create_mock_response("Second").choices[0]
+            mock_response.choices.append(second_choice)
+            mock_client.chat.completions.create = AsyncMock(
+                return_value=mock_response,
+            )
+
+            messages = [{"role": "user", "content": "Hello"}]
+            result = await model(messages, n=2)
+
+            call_args = mock_client.chat.completions.create.call_args[1]
+            self.assertEqual(call_args["n"], 2)
+            self.assertListEqual(
+                [_.content for _ in result],
+                [
+                    [TextBlock(type="text", text="First")],
+                    [TextBlock(type="text", text="Second")],
+                ],
+            )
+
+            model.stream = True
+            with self.assertRaises(ValueError):
+                await model(messages, n=2)
+
+    async def test_batch_call(self) -> None:
+        """Test that the requests in a batch are run concurrently within
+        the limit, and a failed request doesn't fail the whole batch."""
+        with patch("openai.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            model = OpenAIChatModel(
+                model_name="gpt-4",
+                api_key="test_key",
+                stream=False,
+                enable_web_search=False,
+            )
+            model.client = mock_client
+
+            in_flight, max_in_flight = 0, 0
+
+            async def mock_create(**kwargs: Any) -> Mock:
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                content = kwargs["messages"][0]["content"]
+                if content == "fail":
+                    raise RuntimeError("Mock failure")
+                return self._create_mock_response(content)
+
+            mock_client.chat.completions.create = mock_create
+
+            requests = [
+                {"messages": [{"role": "user", "content": str(i)}]}
+                for i in range(5)
+            ]
+            requests.append(
+                {"messages": [{"role": "user", "content": "fail"}]},
+            )
+
+            results = await model.batch_call(requests, max_concurrency=2)
+
+            self.assertEqual(max_in_flight, 2)
+            self.assertListEqual(
+                [_.content[0]["text"] for _ in results[:5]],
+                ["0", "1", "2", "3", "4"],
+            )
+            self.assertIsInstance(results[5], RuntimeError)
+
+            # A non-positive concurrency fails instead of hanging the batch
+            with self.assertRaises(ValueError):
+                await model.batch_call(requests, max_concurrency=0)
+
+    async def test_batch_call_with_rate_limit(self) -> None:
+        """Test that the requests in a batch are spaced out by the rate
+        limit."""
+        with patch("openai.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            model = OpenAIChatModel(
+                model_name="gpt-4",
+                api_key="test_key",
+                stream=False,
+                enable_web_search=False,
+            )
+            model.client = mock_client
+
+            start_times = []
+
+            async def mock_create(**kwargs: Any) -> Mock:
+                start_times.append(time.monotonic())
+                return self._create_mock_response(
+                    kwargs["messages"][0]["content"],
+                )
+
+            mock_client.chat.completions.create = mock_create
+
+            requests = [
+                {"messages": [{"role": "user", "content": str(i)}]}
+                for i in range(3)
+            ]
+            results = await model.batch_call(
+                requests,
+                max_concurrency=3,
+                requests_per_minute=1200,
+            )
+
+            self.assertListEqual(
+                [_.content[0]["text"] for _ in results],
+                ["0", "1", "2"],
+            )
+            # 1200 requests per minute means one request every 0.05 seconds
+            self.assertGreaterEqual(start_times[2] - start_times[0], 0.09)
+
+            with self.assertRaises(ValueError):
+                await model.batch_call(requests, requests_per_minute=0)
+
+    async def test_streaming_response_coalescing(self) -> None:
+        """Test that the streaming chunks are coalesced by stream_chunk_size
+        and the final response is always yielded."""
+        with patch("openai.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            model = OpenAIChatModel(
+                model_name="gpt-4",
+                api_key="test_key",
+                stream=True,
+                enable_web_search=False,
+                stream_chunk_size=10,
+            )
+            model.client = mock_client
+
+            stream_mock = self._create_stream_mock(
+                [
+                    {"content": "Hello"},
+                    {"content": " there"},
+                    {"content": ", how"},
+                    {"content": " are"},
+                ],
+                with_usage=False,
+            )
+            mock_client.chat.completions.create = AsyncMock(
+                return_value=stream_mock,
+            )
+            result = await model([{"role": "user", "content": "Hello"}])
+
+            responses = [response async for response in result]
+
+            # The remaining chunks are flushed when the stream is closed
+            self.assertListEqual(
+                [_.content[0]["text"] for _ in responses],
+                ["Hello there", "Hello there, how are"],
+            )
+
+    def _create_stream_mock(
+        self,
+        chunks_data: list,
+        with_usage: bool = True,
+    ) -> Any:
         """Create a mock stream with proper async context management."""
 
         class MockStream:
@@ -424,9 +706,12 @@ class TestOpenAIChatModel(IsolatedAsyncioTestCase):
 
                 chunk = Mock()
                 chunk.choices = [choice]
-                chunk.usage = Mock()
-                chunk.usage.prompt_tokens = 5
-                chunk.usage.completion_tokens = 10
+                if with_usage:
+                    chunk.usage = Mock()
+                    chunk.usage.prompt_tokens = 5
+                    chunk.usage.completion_tokens = 10
+                else:
+                    chunk.usage = None
                 return chunk
 
         return MockStream(chunks_data)
@@ -213,6 +213,34 @@ class RAGStoreTest(IsolatedAsyncioTestCase):
                 self.assertTrue(mock_client.insert.called)
                 self.assertTrue(mock_client.create_collection.called)
 
+                # Documents are inserted in batches of `batch_size`
+                store.batch_size = 2
+                mock_client.insert.reset_mock()
+                await store.add(
+                    [
+                        Document(
+                            embedding=[0.1, 0.2, 0.3],
+                            metadata=DocMetadata(
+                                content=TextBlock(
+                                    type="text",
+                                    text=f"Test document {i}.",
+                                ),
+                                doc_id="doc2",
+                                chunk_id=i,
+                                total_chunks=3,
+                            ),
+                        )
+                        for i in range(3)
+                    ],
+                )
+                self.assertEqual(
+                    sorted(
+                        [_["chunk_id"] for _ in call.kwargs["data"]]
+                        for call in mock_client.insert.call_args_list
+                    ),
+                    [[0, 1], [2]],
+                )
+
                 res = await store.search(
                     query_embedding=[0.15, 0.25, 0.35],
                     limit=3,